@@ -1398,17 +1398,25 @@ class AssasDatabaseManager:
             logger.info("Found no new archive to collect meta data.")
             return
 
-        try:
-            for document_file in document_files:
+        # Read in this process, forking workers next to the threads of the
+        # MongoDB client is not safe. Unreadable files are returned as None.
+        meta_infos = AssasOdessaNetCDF4Converter.read_meta_values_from_netcdf4_files(
+            netcdf4_files=[
+                document_file.get_value("system_result")
+                for document_file in document_files
+            ]
+        )
+
+        for document_file, meta_info in zip(document_files, meta_infos):
+            if meta_info is None:
+                continue
+
+            try:
                 logger.info(
                     f"Collect meta info from file, "
                     f"filename is {document_file.get_value('system_result')}."
                 )
 
-                meta_info = AssasOdessaNetCDF4Converter.read_meta_values_from_netcdf4(
-                    netcdf4_file=document_file.get_value("system_result")
-                )
-
                 document_file.set_meta_data_values(meta_data_variables=meta_info)
 
                 document_file.set_value(
@@ -1422,8 +1430,8 @@ class AssasDatabaseManager:
                     document_file.get_value("system_path"), document_file.get_document()
                 )
 
-        except Exception as exception:
-            logger.error(f"Update meta info failed due to exception: {exception}.")
+            except Exception as exception:
+                logger.error(f"Update meta info failed due to exception: {exception}.")
 
     def update_meta_data(
         self,
@@ -1452,8 +1460,10 @@ class AssasDatabaseManager:
                 f"{document_file.get_value('system_result')}."
             )
 
-            meta_info = AssasOdessaNetCDF4Converter.read_meta_values_from_netcdf4(
-                netcdf4_file=document_file.get_value("system_result")
+            meta_info = (
+                AssasOdessaNetCDF4Converter.read_variables_meta_values_from_netcdf4(
+                    netcdf4_file=document_file.get_value("system_result")
+                )
             )
 
             document_file.set_meta_data_values(meta_data_variables=meta_info)
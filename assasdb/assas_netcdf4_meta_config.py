@@ -5,14 +5,17 @@ and metadata organization for the ASSAS NetCDF4 format.
 """
 
 import json
-import pkg_resources
 
-with pkg_resources.resource_stream(
-    __name__, "astec_config/assas_netcdf4_domain_group_config.json"
+from importlib.resources import files
+
+ASTEC_CONFIG_PATH = files(__package__).joinpath("astec_config")
+
+with ASTEC_CONFIG_PATH.joinpath("assas_netcdf4_domain_group_config.json").open(
+    "rb"
 ) as json_file:
     DOMAIN_GROUP_CONFIG = json.load(json_file)
-with pkg_resources.resource_stream(
-    __name__, "astec_config/assas_netcdf4_meta_data_var_names.json"
+with ASTEC_CONFIG_PATH.joinpath("assas_netcdf4_meta_data_var_names.json").open(
+    "rb"
 ) as json_file:
     META_DATA_VAR_NAMES = json.load(json_file)
 
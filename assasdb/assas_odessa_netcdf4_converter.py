@@ -16,12 +16,16 @@ import netCDF4
 import logging
 import numpy as np
 import pandas as pd
-import pkg_resources
 import json
 import shutil
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, lru_cache, partial
+from itertools import chain, zip_longest
+from importlib.resources import files
 from tqdm import tqdm
-from typing import List, Union, Optional
+from typing import Callable, Iterator, List, Tuple, Union, Optional
 from pathlib import Path
 from .assas_netcdf4_meta_config_old import META_DATA_VAR_NAMES, DOMAIN_GROUP_CONFIG
 from .assas_unit_manager import AssasUnitManager
@@ -29,6 +33,42 @@ from .assas_unit_manager import AssasUnitManager
 logger = logging.getLogger("assas_app")
 
 LOG_INTERVAL = 100
+WRITE_BUFFER_SIZE = 64
+COMPRESSION_LEVEL = 4
+CHUNK_BYTES = 2**20
+CHUNK_CACHE_SIZE = 2**24
+# Strategies reading one value per numbered structure of a container:
+# (container path, structure name, substructure path, first value only).
+# A container path of None refers to the odessa base itself, a substructure path
+# of None reads the variable directly from the numbered structure.
+STRUCTURE_PARSER_SPECS = {
+    "vessel_mesh_ther": ("VESSEL 1", "MESH", "THER 1", True),
+    "vessel_mesh": ("VESSEL 1", "MESH", None, False),
+    "vessel_face_ther": ("VESSEL 1", "FACE", "THER 1", True),
+    "primary_junction_ther": ("PRIMARY 1", "JUNCTION", "THER 1", True),
+    "primary_junction_geom": ("PRIMARY 1", "JUNCTION", "GEOM 1", True),
+    "primary_volume_ther": ("PRIMARY 1", "VOLUME", "THER 1", True),
+    "primary_volume_geom": ("PRIMARY 1", "VOLUME", "GEOM 1", True),
+    "primary_pipe_ther": ("PRIMARY 1", "PIPE", "THER 1", False),
+    "secondar_junction_ther": ("SECONDAR 1", "JUNCTION", "THER 1", True),
+    "secondar_junction_geom": ("SECONDAR 1", "JUNCTION", "GEOM 1", True),
+    "secondar_volume_ther": ("SECONDAR 1", "VOLUME", "THER 1", True),
+    "primary_wall": ("PRIMARY 1", "WALL", None, False),
+    "primary_wall_ther": ("PRIMARY 1", "WALL", "THER 1", True),
+    "primary_wall_ther_2": ("PRIMARY 1", "WALL", "THER 2", True),
+    "primary_wall_geom": ("PRIMARY 1", "WALL", "GEOM 1", True),
+    "secondar_wall": ("SECONDAR 1", "WALL", None, False),
+    "secondar_wall_ther": ("SECONDAR 1", "WALL", "THER 1", True),
+    "secondar_wall_ther_2": ("SECONDAR 1", "WALL", "THER 2", True),
+    "secondar_wall_geom": ("SECONDAR 1", "WALL", "GEOM 1", True),
+    "systems_pump": ("SYSTEMS 1", "PUMP", None, True),
+    "systems_valve": ("SYSTEMS 1", "VALVE", None, True),
+    "containment_zone": ("CONTAINM 1", "ZONE", None, True),
+    "containment_zone_ther": ("CONTAINM 1", "ZONE", "THER 1", True),
+    "containment_conn": ("CONTAINM 1", "CONN", None, True),
+    "connecti_heat": (None, "CONNECTI", "HEAT 1", True),
+}
+
 ASTEC_ROOT = os.environ.get("ASTEC_ROOT")
 ASTEC_TYPE = os.environ.get("ASTEC_TYPE")
 
@@ -42,6 +82,47 @@ if ASTEC_PYTHON_ODESSA not in sys.path:
 
 import pyodessa as pyod  # noqa: E402
 
+# State of a worker process converting time points in parallel
+_conversion_worker = {}
+
+
+def _initialize_conversion_worker(
+    converter: "AssasOdessaNetCDF4Converter",
+    variable_names: List[str],
+) -> None:
+    """Initialize a worker process for the parallel conversion of time points.
+
+    Args:
+        converter (AssasOdessaNetCDF4Converter): Converter of the parent process.
+        variable_names (List[str]): Names of the variables to convert.
+
+    Returns:
+        None
+
+    """
+    _conversion_worker["converter"] = converter
+    _conversion_worker["conversion_plan"] = converter.get_conversion_plan(
+        {variable_name: None for variable_name in variable_names}
+    )
+
+
+def _parse_time_point_in_worker(time_point: float) -> List[np.ndarray]:
+    """Parse the ASTEC variables of one time point in a worker process.
+
+    Args:
+        time_point (float): The time point to parse.
+
+    Returns:
+        List[np.ndarray]: The parsed data in the order of the conversion plan.
+
+    """
+    converter = _conversion_worker["converter"]
+    odessa_base = pyod.restore(str(converter.input_path), time_point)
+
+    return converter.parse_odessa_base(
+        odessa_base, _conversion_worker["conversion_plan"]
+    )
+
 
 class AssasOdessaNetCDF4Converter:
     """Class to convert ASTEC binary archive to netCDF4 format.
@@ -49,6 +130,10 @@ class AssasOdessaNetCDF4Converter:
     This class reads an ASTEC binary archive and converts it to a netCDF4 dataset.
     """
 
+    # Substructures of the odessa base which is currently converted, cleared with
+    # clear_odessa_base_cache when the odessa base is parsed
+    _odessa_structure_cache = {"odessa_base": None, "structures": {}, "lengths": {}}
+
     def __init__(
         self,
         input_path: Union[str, Path],
@@ -79,10 +164,6 @@ class AssasOdessaNetCDF4Converter:
 
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.time_points = pyod.get_saving_times(str(self.input_path))
-        logger.info(f"Read {len(self.time_points)} time points from ASTEC archive.")
-        logger.debug(f"List of time points: {self.time_points}.")
-
         self.variable_index_file_list = variable_index_file_list or [
             "astec_config/inr/assas_variables_cavity.csv",
             "astec_config/inr/assas_variables_containment.csv",
@@ -112,87 +193,72 @@ class AssasOdessaNetCDF4Converter:
             "astec_config/inr/assas_variables_sensor.csv",
         ]
 
-        self.variable_index = self.read_astec_variable_index_files(report=True)
-
-        self.magma_debris_ids = self.read_vessel_magma_debris_ids(
-            resource_file="astec_config/inr/assas_variables_vessel_magma_debris_ids.csv"
-        )
-        self.fuel_ids = self.read_csv_resource_file(
-            resource_file="astec_config/inr/assas_variables_vessel_fuel_ids.csv"
-        )
-        self.clad_ids = self.read_csv_resource_file(
-            resource_file="astec_config/inr/assas_variables_vessel_clad_ids.csv"
-        )
-        self.component_states = self.read_csv_resource_file(
-            resource_file="astec_config/inr/assas_variables_component_states.csv"
-        )
-
         self.variable_strategy_mapping = {
-            "primary_pipe_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_primary_pipe_ther
+            "primary_pipe_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "primary_pipe_ther"
             ),
             "primary_pipe_geom": (
                 AssasOdessaNetCDF4Converter.parse_variable_from_primary_pipe_geom
             ),
-            "primary_volume_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_primary_volume_ther
+            "primary_volume_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "primary_volume_ther"
             ),
-            "primary_volume_geom": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_primary_volume_geom
+            "primary_volume_geom": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "primary_volume_geom"
             ),
-            "primary_junction_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_primary_junction_ther
+            "primary_junction_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "primary_junction_ther"
             ),
-            "primary_junction_geom": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_primary_junction_geom
+            "primary_junction_geom": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "primary_junction_geom"
             ),
-            "primary_wall": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_primary_wall
+            "primary_wall": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "primary_wall"
             ),
-            "primary_wall_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_primary_wall_ther
+            "primary_wall_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "primary_wall_ther"
             ),
-            "primary_wall_ther_2": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_primary_wall_ther_2
+            "primary_wall_ther_2": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "primary_wall_ther_2"
             ),
-            "primary_wall_geom": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_primary_wall_geom
+            "primary_wall_geom": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "primary_wall_geom"
             ),
-            "secondar_pipe_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_primary_pipe_ther
+            "secondar_pipe_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "primary_pipe_ther"
             ),
             "secondar_pipe_geom": (
                 AssasOdessaNetCDF4Converter.parse_variable_from_primary_pipe_geom
             ),
-            "secondar_volume_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_secondar_volume_ther
+            "secondar_volume_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "secondar_volume_ther"
             ),
-            "secondar_junction_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_secondar_junction_ther
+            "secondar_junction_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "secondar_junction_ther"
             ),
-            "secondar_junction_geom": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_secondar_junction_geom
+            "secondar_junction_geom": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "secondar_junction_geom"
             ),
-            "secondar_wall": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_secondar_wall
+            "secondar_wall": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "secondar_wall"
             ),
-            "secondar_wall_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_secondar_wall_ther
+            "secondar_wall_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "secondar_wall_ther"
             ),
-            "secondar_wall_ther_2": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_secondar_wall_ther_2
+            "secondar_wall_ther_2": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "secondar_wall_ther_2"
             ),
-            "secondar_wall_geom": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_secondar_wall_geom
+            "secondar_wall_geom": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "secondar_wall_geom"
             ),
-            "vessel_face_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_vessel_face_ther
+            "vessel_face_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "vessel_face_ther"
             ),
-            "vessel_mesh_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_vessel_mesh_ther
+            "vessel_mesh_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "vessel_mesh_ther"
             ),
-            "vessel_mesh": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_vessel_mesh
+            "vessel_mesh": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "vessel_mesh"
             ),
             "vessel_general": (
                 AssasOdessaNetCDF4Converter.parse_variable_from_vessel_general
@@ -200,24 +266,24 @@ class AssasOdessaNetCDF4Converter:
             "fp_heat_vessel": (
                 AssasOdessaNetCDF4Converter.parse_variable_from_fp_heat_vessel
             ),
-            "systems_pump": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_systems_pump
+            "systems_pump": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "systems_pump"
             ),
-            "systems_valve": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_systems_valve
+            "systems_valve": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "systems_valve"
             ),
             "sensor": (AssasOdessaNetCDF4Converter.parse_variable_from_sensor),
             "containment_dome": (
                 AssasOdessaNetCDF4Converter.parse_variable_from_containment_dome
             ),
-            "containment_zone": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_containment_zone
+            "containment_zone": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "containment_zone"
             ),
-            "containment_zone_ther": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_containment_zone_ther
+            "containment_zone_ther": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "containment_zone_ther"
             ),
-            "containment_conn": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_containment_conn
+            "containment_conn": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "containment_conn"
             ),
             "containment_wall_temp": (
                 AssasOdessaNetCDF4Converter.parse_variable_from_containment_wall_temp
@@ -226,8 +292,8 @@ class AssasOdessaNetCDF4Converter:
                 AssasOdessaNetCDF4Converter.parse_variable_from_containment_pool
             ),
             "connecti": (AssasOdessaNetCDF4Converter.parse_variable_from_connecti),
-            "connecti_heat": (
-                AssasOdessaNetCDF4Converter.parse_variable_from_connecti_heat
+            "connecti_heat": AssasOdessaNetCDF4Converter.get_structure_parser(
+                "connecti_heat"
             ),
             "connecti_source": (
                 AssasOdessaNetCDF4Converter.parse_variable_from_connecti_source
@@ -253,6 +319,184 @@ class AssasOdessaNetCDF4Converter:
             ),
         }
 
+    @cached_property
+    def time_points(self) -> List[float]:
+        """Read the time points of the ASTEC archive on first access.
+
+        Returns:
+            List[float]: The saving times of the ASTEC archive.
+
+        """
+        time_points = pyod.get_saving_times(str(self.input_path))
+        logger.info(f"Read {len(time_points)} time points from ASTEC archive.")
+        logger.debug("List of time points: %s.", time_points)
+
+        return time_points
+
+    @cached_property
+    def variable_index(self) -> pd.DataFrame:
+        """Read the ASTEC variable index files on first access.
+
+        Returns:
+            pd.DataFrame: The variable index of the converter.
+
+        """
+        return self.read_astec_variable_index_files()
+
+    @cached_property
+    def magma_debris_ids(self) -> pd.DataFrame:
+        """Read the vessel magma debris ids on first access.
+
+        Returns:
+            pd.DataFrame: The magma debris ids per mesh.
+
+        """
+        return self.read_vessel_magma_debris_ids(
+            resource_file="astec_config/inr/assas_variables_vessel_magma_debris_ids.csv"
+        )
+
+    @cached_property
+    def fuel_ids(self) -> pd.DataFrame:
+        """Read the vessel fuel ids on first access.
+
+        Returns:
+            pd.DataFrame: The fuel component ids.
+
+        """
+        return self.read_csv_resource_file(
+            resource_file="astec_config/inr/assas_variables_vessel_fuel_ids.csv"
+        )
+
+    @cached_property
+    def clad_ids(self) -> pd.DataFrame:
+        """Read the vessel clad ids on first access.
+
+        Returns:
+            pd.DataFrame: The clad component ids.
+
+        """
+        return self.read_csv_resource_file(
+            resource_file="astec_config/inr/assas_variables_vessel_clad_ids.csv"
+        )
+
+    @cached_property
+    def component_states(self) -> pd.DataFrame:
+        """Read the component states on first access.
+
+        Returns:
+            pd.DataFrame: The component states and their codes.
+
+        """
+        return self.read_csv_resource_file(
+            resource_file="astec_config/inr/assas_variables_component_states.csv"
+        )
+
+    @cached_property
+    def component_state_codes(self) -> dict:
+        """Get the codes of the component states as dictionary.
+
+        Returns:
+            dict: Mapping of the component state strings to their integer codes.
+
+        """
+        return {
+            state: int(code)
+            for state, code in zip(
+                self.component_states["state"].tolist(),
+                self.component_states["code"].tolist(),
+            )
+        }
+
+    @cached_property
+    def fuel_id_array(self) -> np.ndarray:
+        """Get the fuel component ids as array.
+
+        Returns:
+            np.ndarray: The fuel component ids.
+
+        """
+        return self.fuel_ids["fuel_id"].to_numpy(dtype=np.int64)
+
+    @cached_property
+    def clad_id_array(self) -> np.ndarray:
+        """Get the clad component ids as array.
+
+        Returns:
+            np.ndarray: The clad component ids.
+
+        """
+        return self.clad_ids["clad_id"].to_numpy(dtype=np.int64)
+
+    @cached_property
+    def fuel_comp_paths(self) -> Tuple[str, ...]:
+        """Get the odessa paths of the fuel components.
+
+        Returns:
+            Tuple[str, ...]: The paths "VESSEL 1: COMP <fuel_id>".
+
+        """
+        return tuple(f"VESSEL 1: COMP {comp_id}" for comp_id in self.fuel_id_array)
+
+    @cached_property
+    def clad_comp_paths(self) -> Tuple[str, ...]:
+        """Get the odessa paths of the clad components.
+
+        Returns:
+            Tuple[str, ...]: The paths "VESSEL 1: COMP <clad_id>".
+
+        """
+        return tuple(f"VESSEL 1: COMP {comp_id}" for comp_id in self.clad_id_array)
+
+    @cached_property
+    def magma_debris_id_arrays(self) -> dict:
+        """Get the magma debris as (mesh index, component path) pairs per variable.
+
+        Rows without component id are dropped.
+
+        Returns:
+            dict: Mapping of the variable names to the zero-based mesh indices and
+            the odessa paths of the components.
+
+        """
+        mesh_index_array = self.magma_debris_ids["mesh_id"].to_numpy(dtype=np.int64) - 1
+        magma_debris_id_arrays = {}
+        for column in self.magma_debris_ids.columns:
+            if column == "mesh_id":
+                continue
+            has_id = self.magma_debris_ids[column].notna().to_numpy()
+            comp_ids = self.magma_debris_ids[column][has_id].to_numpy(dtype=np.int64)
+            magma_debris_id_arrays[column] = (
+                mesh_index_array[has_id],
+                tuple(f"VESSEL 1: COMP {comp_id}" for comp_id in comp_ids),
+            )
+
+        return magma_debris_id_arrays
+
+    def __getstate__(self) -> dict:
+        """Get the state of the converter to transfer it to worker processes.
+
+        Returns:
+            dict: The state of the converter without the unit manager.
+
+        """
+        state = self.__dict__.copy()
+        del state["unit_manager"]
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the state of the converter in a worker process.
+
+        Args:
+            state (dict): The state of the converter without the unit manager.
+
+        Returns:
+            None
+
+        """
+        self.__dict__.update(state)
+        self.unit_manager = AssasUnitManager()
+
     def get_time_points(self) -> List[int]:
         """Get the time points from the ASTEC archive.
 
@@ -292,61 +536,99 @@ class AssasOdessaNetCDF4Converter:
         contains the variable names, IDs, and other relevant information.
 
         Args:
-            report (bool): If True, save the dataframe to a CSV file for
-            reporting purposes.
+            report (bool): If True, export the dataframe with
+            export_variable_index_report for reporting purposes.
 
         Returns:
             pd.DataFrame: A dataframe containing the ASTEC variable index.
 
         """
-        file_list = self.variable_index_file_list
-
-        dataframe_list = []
-        for file in file_list:
-            with pkg_resources.resource_stream(__name__, file) as csv_file:
-                dataframe = pd.read_csv(csv_file)
-                dataframe_list.append(dataframe)
-
-        dataframe = pd.concat(dataframe_list).reset_index(drop=True)
+        # Copy the cached index, so that changes do not leak into other instances
+        dataframe = AssasOdessaNetCDF4Converter.load_variable_index_files(
+            tuple(self.variable_index_file_list)
+        ).copy()
         logger.info(f"Shape of variable index is {dataframe.shape}.")
 
         if report:
-            output_file = (
-                os.path.dirname(os.path.realpath(__file__))
-                + "/astec_config/assas_variables_wp2_report.csv"
-            )
-            dataframe.to_csv(output_file)
+            self.export_variable_index_report(dataframe)
+
+        return dataframe
+
+    def export_variable_index_report(
+        self,
+        dataframe: Optional[pd.DataFrame] = None,
+    ) -> None:
+        """Export the variable index as CSV file and its head as LaTeX table.
+
+        The files are written to the astec_config directory of the package.
 
-            output_file_latex = (
-                os.path.dirname(os.path.realpath(__file__))
-                + "/astec_config/assas_variables_wp2_report_head.tex"
+        Args:
+            dataframe (Optional[pd.DataFrame]): The variable index to export.
+                Defaults to None, which exports the variable index of the converter.
+
+        Returns:
+            None
+
+        """
+        if dataframe is None:
+            dataframe = self.variable_index
+
+        output_file = (
+            os.path.dirname(os.path.realpath(__file__))
+            + "/astec_config/assas_variables_wp2_report.csv"
+        )
+        dataframe.to_csv(output_file)
+
+        output_file_latex = (
+            os.path.dirname(os.path.realpath(__file__))
+            + "/astec_config/assas_variables_wp2_report_head.tex"
+        )
+        indices = list(range(0, 5)) + list(range(104, 110))
+        dataframe_head = dataframe[
+            [
+                "name",
+                "long_name",
+                "name_odessa",
+                "unit",
+                "domain",
+                "strategy",
+                "dimension",
+            ]
+        ].iloc[indices]
+        with open(output_file_latex, "w") as f:
+            logger.info(
+                f"Write head of dataframe to LaTeX file {f.name} "
+                "for reporting purposes."
+            )
+            dataframe_head.to_latex(
+                buf=f,
+                index=False,
+                escape=False,
+                caption="Selected Variables",
+                label="tab:variables",
             )
-            indices = list(range(0, 5)) + list(range(104, 110))
-            dataframe_head = dataframe[
-                [
-                    "name",
-                    "long_name",
-                    "name_odessa",
-                    "unit",
-                    "domain",
-                    "strategy",
-                    "dimension",
-                ]
-            ].iloc[indices]
-            with open(output_file_latex, "w") as f:
-                logger.info(
-                    f"Write head of dataframe to LaTeX file {f.name} "
-                    "for reporting purposes."
-                )
-                dataframe_head.to_latex(
-                    buf=f,
-                    index=False,
-                    escape=False,
-                    caption="Selected Variables",
-                    label="tab:variables",
-                )
 
-        return dataframe
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def load_variable_index_files(file_list: Tuple[str, ...]) -> pd.DataFrame:
+        """Load and concatenate ASTEC variable index files once per process.
+
+        Args:
+            file_list (Tuple[str, ...]): Resource paths of the variable index files.
+
+        Returns:
+            pd.DataFrame: The concatenated variable index. The dataframe is shared
+            between all callers and must not be modified.
+
+        """
+        dataframe_list = []
+        for file in file_list:
+            with files(__package__).joinpath(file).open("rb") as csv_file:
+                dataframe_list.append(pd.read_csv(csv_file))
+
+        logger.info(f"Loaded {len(dataframe_list)} variable index files.")
+
+        return pd.concat(dataframe_list, ignore_index=True)
 
     def read_vessel_magma_debris_ids(
         self,
@@ -382,11 +664,11 @@ class AssasOdessaNetCDF4Converter:
             pd.DataFrame: DataFrame containing the data from the CSV file.
 
         """
-        with pkg_resources.resource_stream(__name__, resource_file) as csv_file:
+        with files(__package__).joinpath(resource_file).open("rb") as csv_file:
             logger.info(f"Read csv resource file {csv_file}.")
             dataframe = pd.read_csv(csv_file)
 
-        logger.debug(f"{dataframe}")
+        logger.debug("%s", dataframe)
 
         return dataframe
 
@@ -405,1003 +687,274 @@ class AssasOdessaNetCDF4Converter:
             bool: True if the path exists, False otherwise.
 
         """
-        keys = odessa_path.split(":")
-        nkeys = len(keys)
-        is_valid_path = True
-
-        logger.debug(f"Keys of odessa_path: {keys}. Depth of path: {nkeys}.")
-
-        for count, var in enumerate(keys, start=1):
-            logger.debug("   ------")
-            var = var.strip()
-            logger.debug(f"Handle key {var}.")
-            num_stru = 1
-
-            if " " in var:
-                name_stru = var.split(" ")[0]
-                num_stru = var.split(" ")[1]
-
-            elif "[" in var:
-                name_stru = var.split("[")[0]
-
-            if count == 1:  # Using initiale base argument
-                len_odessa_base = odessa_base.len(name_stru.replace("'", ""))
-
-                if len_odessa_base >= int(num_stru):
-                    if count < nkeys:  # getting next structure
-                        new_base = odessa_base.get(name_stru + " " + num_stru)
-                else:
-                    is_valid_path = False
-                    break
-
-            else:  # Using substructure
-                len_odessa_base = new_base.len(name_stru.replace("'", ""))
+        # The parent is resolved through the structure cache, so checks of
+        # sibling paths walk their common prefix only once per odessa base
+        parent_path, separator, key = odessa_path.rpartition(":")
+        if separator:
+            structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                odessa_base, parent_path
+            )
+            if structure is None:
+                return False
+        else:
+            structure = odessa_base
 
-                if len_odessa_base >= int(num_stru):
-                    if count < nkeys:  # getting next structure
-                        new_base = new_base.get(name_stru + " " + num_stru)
-                else:
-                    is_valid_path = False
-                    break
+        length_key, number, _, _ = AssasOdessaNetCDF4Converter.parse_odessa_path(key)[0]
 
-        return is_valid_path
+        return structure.len(length_key) >= number
 
     @staticmethod
-    def convert_odessa_structure_to_float(
-        odessa_structure: Union[pyod.R1, float],
-    ) -> float:
-        """Convert an Odessa structure to a float value.
+    @lru_cache(maxsize=None)
+    def parse_odessa_path(
+        odessa_path: str,
+    ) -> Tuple[Tuple[str, int, str, str], ...]:
+        """Split an odessa path into the keys needed to walk the odessa base.
+
+        The keys of a path are parsed once and reused for all time points.
 
         Args:
-            odessa_structure: The odessa structure to convert.
+            odessa_path (str): The odessa path, e.g. "VESSEL 1: MESH 2: THER 1".
 
         Returns:
-            float: The converted float value.
+            Tuple[Tuple[str, int, str, str], ...]: For each key of the path the
+            name to get the number of structures, the number of the structure,
+            the key to get the structure and the stripped key of the path.
 
         """
-        value = []
-
-        if isinstance(odessa_structure, pyod.R1):
-            value = odessa_structure[0]
-        elif isinstance(odessa_structure, float):
-            value = odessa_structure
-        else:
-            logger.error("Unkown type.")
+        keys = []
+        for key in odessa_path.split(":"):
+            key = key.strip()
+            name_stru, separator, num_stru = key.partition(" ")
+            if separator:
+                num_stru = num_stru.partition(" ")[0]
+            else:
+                name_stru = name_stru.partition("[")[0]
+                num_stru = "1"
+
+            keys.append(
+                (
+                    name_stru.replace("'", ""),
+                    int(num_stru),
+                    name_stru + " " + num_stru,
+                    key,
+                )
+            )
 
-        return value
+        return tuple(keys)
 
-    def parse_variable_vessel_magma_debris(
-        self,
+    @staticmethod
+    def get_odessa_structure_if_exists(
         odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from magma debris.
+        odessa_path: str,
+    ) -> Optional[Union[pyod.Base, pyod.R1, float, str]]:
+        """Get a structure of the odessa base if the given Odessa path exists.
+
+        The path is walked only once, in contrast to checking the path with
+        check_if_odessa_path_exists and getting it from the odessa base afterwards.
 
         Args:
             odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
+            odessa_path (str): The path to get from the odessa base.
 
         Returns:
-            np.ndarray: An array containing the parsed variable data.
+            Optional[Union[pyod.Base, pyod.R1, float, str]]: The structure at the
+            given path, None if the path does not exist.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type vessel_magma_debris.")
-
-        array = np.full((len(self.magma_debris_ids.index)), fill_value=np.nan)
-        logger.debug(f"Initialized array with shape {array.shape}.")
-
-        for _, dataframe_row in self.magma_debris_ids.iterrows():
-            mesh_id = dataframe_row["mesh_id"]
-            variable_id = dataframe_row[variable_name]
+        keys = AssasOdessaNetCDF4Converter.parse_odessa_path(odessa_path)
+        last_key_index = len(keys) - 1
 
-            logger.debug(f"Handle mesh_id {mesh_id} and variable_id {variable_id}.")
+        structure = odessa_base
+        for key_index, (length_key, number, structure_key, key) in enumerate(keys):
+            if structure.len(length_key) < number:
+                return None
 
-            if not np.isnan(variable_id):
-                odessa_path = f"VESSEL 1: COMP {int(variable_id)}: M 1"
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
+            if key_index < last_key_index:  # getting next structure
+                structure = structure.get(structure_key)
+            else:
+                structure = structure.get(key)
 
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[int(mesh_id) - 1] = variable_structure
+        return structure
 
-        return array
+    @staticmethod
+    def get_odessa_base_cache(odessa_base: pyod.Base) -> dict:
+        """Get the structure cache, cleared if it belongs to another odessa base.
 
-    def parse_variable_vessel_fuel(
-        self,
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from vessel fuel.
+        The conversion loops clear the cache explicitly with
+        clear_odessa_base_cache at the end of each time point, the check of the
+        odessa base only guards direct calls of the strategy functions.
 
         Args:
             odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
 
         Returns:
-            np.ndarray: An array containing the parsed variable data.
+            dict: The cache with the structures ("structures") and the numbers of
+            structures ("lengths") read from the odessa base.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type vessel_fuel.")
-
-        array = np.full((len(self.fuel_ids.index)), fill_value=np.nan)
-        logger.debug(f"Initialized array with shape {array.shape}.")
-
-        for idx, dataframe_row in self.fuel_ids.iterrows():
-            comp_id = dataframe_row["fuel_id"]
-
-            logger.debug(f"Handle comp_id {comp_id}.")
+        cache = AssasOdessaNetCDF4Converter._odessa_structure_cache
+        if cache["odessa_base"] is not odessa_base:
+            cache["odessa_base"] = odessa_base
+            cache["structures"] = {}
+            cache["lengths"] = {}
 
-            odessa_path = f"VESSEL 1: COMP {int(comp_id)}: {variable_name} 1"
+        return cache
 
-            if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                odessa_base, odessa_path
-            ):
-                variable_structure = odessa_base.get(odessa_path)
+    @staticmethod
+    def clear_odessa_base_cache() -> None:
+        """Clear the structure cache, so that it holds no odessa base anymore.
 
-                logger.debug(f"Collect variable structure {variable_structure}.")
-                array[idx] = variable_structure
+        Returns:
+            None
 
-        return array
+        """
+        cache = AssasOdessaNetCDF4Converter._odessa_structure_cache
+        cache["odessa_base"] = None
+        cache["structures"] = {}
+        cache["lengths"] = {}
 
-    def parse_variable_vessel_clad(
-        self,
+    @staticmethod
+    def get_cached_number_of_structures(
         odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from vessel clad.
+        container_path: Optional[str],
+        structure_name: str,
+    ) -> int:
+        """Get the number of structures in a container and cache it for further calls.
+
+        Variables of the same structures, e.g. all variables of "PRIMARY 1: VOLUME",
+        share one len call per odessa base.
 
         Args:
             odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
+            container_path (Optional[str]): Path to the container. None if the
+                structures belong to the odessa base itself.
+            structure_name (str): Name of the numbered structures, e.g. "VOLUME".
 
         Returns:
-            np.ndarray: An array containing the parsed variable data.
+            int: The number of structures, 0 if the container does not exist.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type vessel_clad.")
-
-        array = np.full((len(self.clad_ids.index)), fill_value=np.nan)
-        logger.debug(f"Initialized array with shape {array.shape}.")
-
-        for idx, dataframe_row in self.clad_ids.iterrows():
-            comp_id = dataframe_row["clad_id"]
-
-            logger.debug(f"Handle comp_id {comp_id}.")
-
-            odessa_path = f"VESSEL 1: COMP {int(comp_id)}: {variable_name} 1"
-
-            if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                odessa_base, odessa_path
-            ):
-                variable_structure = odessa_base.get(odessa_path)
-
-                logger.debug(f"Collect variable structure {variable_structure}.")
-                array[idx] = variable_structure
+        lengths = AssasOdessaNetCDF4Converter.get_odessa_base_cache(odessa_base)[
+            "lengths"
+        ]
+        key = (container_path, structure_name)
+        if key not in lengths:
+            if container_path is None:
+                container = odessa_base
+            else:
+                container = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                    odessa_base, container_path
+                )
+            lengths[key] = 0 if container is None else container.len(structure_name)
 
-        return array
+        return lengths[key]
 
-    def parse_variable_vessel_fuel_stat(
-        self,
+    @staticmethod
+    def get_cached_odessa_structure(
         odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from vessel fuel status.
+        odessa_path: str,
+    ) -> Optional[Union[pyod.Base, pyod.R1, float, str]]:
+        """Get a substructure of the odessa base and cache it for further calls.
+
+        The cache only holds substructures of one odessa base and is cleared as
+        soon as the structure of another odessa base is requested. Variables
+        read by single path share the cached parents of their paths, e.g. all
+        variables of "CONTAINM 1: ZONE 10: THER 1".
 
         Args:
             odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
+            odessa_path (str): The path to the substructure in the odessa base.
 
         Returns:
-            np.ndarray: An array containing the parsed variable data.
+            Optional[Union[pyod.Base, pyod.R1, float, str]]: The substructure,
+            None if the path does not exist.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type vessel_fuel_stat.")
+        structures = AssasOdessaNetCDF4Converter.get_odessa_base_cache(odessa_base)[
+            "structures"
+        ]
+        if odessa_path not in structures:
+            # Resolve the parent through the cache, so that sibling structures
+            # like "VESSEL 1: COMP 1" and "VESSEL 1: COMP 2" share one walk
+            parent_path, separator, key = odessa_path.rpartition(":")
+            if separator:
+                parent = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                    odessa_base, parent_path
+                )
+            else:
+                parent = odessa_base
 
-        array = np.full((len(self.fuel_ids.index)), fill_value=np.nan)
-        logger.debug(f"Initialized array with shape {array.shape}.")
+            structures[odessa_path] = (
+                None
+                if parent is None
+                else AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                    parent, key
+                )
+            )
 
-        for idx, dataframe_row in self.fuel_ids.iterrows():
-            comp_id = dataframe_row["fuel_id"]
-
-            logger.debug(f"Handle comp_id {comp_id}.")
-
-            odessa_path = f"VESSEL 1: COMP {int(comp_id)}: {variable_name} 1"
-
-            if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                odessa_base, odessa_path
-            ):
-                variable_structure = odessa_base.get(odessa_path)
-
-                component_state = self.component_states.loc[
-                    self.component_states["state"] == variable_structure
-                ]
-                component_state_code = component_state["code"]
-
-                logger.debug(
-                    f"Collect variable structure string {variable_structure}, "
-                    f"what corresponds to code {int(component_state_code.iloc[0])}."
-                )
-                array[idx] = int(component_state_code.iloc[0])
-
-        return array
-
-    def parse_variable_vessel_clad_stat(
-        self,
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from vessel clad status.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type vessel_clad_stat.")
-
-        array = np.full((len(self.clad_ids.index)), fill_value=np.nan)
-        logger.debug(f"Initialized array with shape {array.shape}.")
-
-        for idx, dataframe_row in self.clad_ids.iterrows():
-            comp_id = dataframe_row["clad_id"]
-
-            logger.debug(f"Handle comp_id {comp_id}.")
-
-            odessa_path = f"VESSEL 1: COMP {int(comp_id)}: {variable_name} 1"
-
-            if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                odessa_base, odessa_path
-            ):
-                variable_structure = odessa_base.get(odessa_path)
-
-                component_state = self.component_states.loc[
-                    self.component_states["state"] == variable_structure
-                ]
-                component_state_code = component_state["code"]
-
-                logger.debug(
-                    f"Collect variable structure string {variable_structure}, "
-                    f"what corresponds to code {int(component_state_code.iloc[0])}."
-                )
-                array[idx] = int(component_state_code.iloc[0])
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_vessel_mesh_ther(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from vessel mesh thermal data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type vessel_mesh_ther.")
-
-        vessel_mesh_check_path = "VESSEL 1: MESH 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, vessel_mesh_check_path
-        ):
-            vessel = odessa_base.get("VESSEL")
-            number_of_meshes = vessel.len("MESH")
-
-            array = np.full((number_of_meshes), fill_value=np.nan)
-            logger.debug(f"Initialized array with shape {array.shape}.")
-
-            for idx, mesh_number in enumerate(range(1, number_of_meshes + 1)):
-                logger.debug(f"Index is {idx}, mesh_number is {mesh_number}.")
-
-                odessa_path = f"VESSEL 1: MESH {mesh_number}: THER 1: {variable_name} 1"
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {vessel_mesh_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_vessel_mesh(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from vessel mesh data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type vessel_mesh.")
-
-        vessel_mesh_check_path = "VESSEL 1: MESH 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, vessel_mesh_check_path
-        ):
-            vessel = odessa_base.get("VESSEL")
-            number_of_meshes = vessel.len("MESH")
-
-            array = np.full((number_of_meshes), fill_value=np.nan)
-            logger.debug(f"Initialized array with shape {array.shape}.")
-
-            for idx, mesh_number in enumerate(range(1, number_of_meshes + 1)):
-                logger.debug(f"Mesh number {mesh_number}.")
-
-                odessa_path = f"VESSEL 1: MESH {mesh_number}: {variable_name} 1"
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure
-
-        else:
-            logger.debug(
-                f"Path {vessel_mesh_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_vessel_face_ther(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from vessel face thermal data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type vessel_face_ther.")
-
-        vessel_face_check_path = "VESSEL 1: FACE 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, vessel_face_check_path
-        ):
-            vessel = odessa_base.get("VESSEL")
-            number_of_faces = vessel.len("FACE")
-
-            logger.debug(f"Number of faces in vessel: {number_of_faces}.")
-
-            array = np.full((number_of_faces), fill_value=np.nan)
-
-            for idx, face_number in enumerate(range(1, number_of_faces + 1)):
-                odessa_path = f"VESSEL 1: FACE {face_number}: THER 1: {variable_name} 1"
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {vessel_face_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_vessel_general(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from vessel general data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type vessel_general.")
-
-        odessa_path = f"VESSEL 1: GENERAL 1: {variable_name} 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, odessa_path
-        ):
-            variable_structure = odessa_base.get(odessa_path)
-            logger.debug(f"Collect variable structure {variable_structure}.")
-            array = np.array([variable_structure])
-
-        else:
-            logger.debug(
-                f"Variable {variable_name} not in odessa base, "
-                "fill datapoint with np.nan."
-            )
-            array = np.array([np.nan])
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_fp_heat_vessel(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from fuel pin heat vessel data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type fp_heat_vessel.")
-
-        odessa_path = f"FP_HEAT 1: VESSEL 1: {variable_name} 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, odessa_path
-        ):
-            variable_structure = odessa_base.get(odessa_path)
-            logger.debug(f"Collect variable structure {variable_structure}.")
-            array = np.array([variable_structure[0]])
-
-        else:
-            logger.debug(
-                f"Variable {variable_name} not in odessa base, "
-                "fill datapoint with np.nan."
-            )
-            array = np.array([np.nan])
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_primary_junction_ther(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from primary junction thermal data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(
-            f"Parse ASTEC variable {variable_name}, type primary_junction_ther."
-        )
-
-        primary_junction_check_path = "PRIMARY 1: JUNCTION 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, primary_junction_check_path
-        ):
-            primary = odessa_base.get("PRIMARY")
-            number_of_junctions = primary.len("JUNCTION")
-
-            logger.debug(f"Number of junctions in primary: {number_of_junctions}.")
-
-            array = np.full((number_of_junctions), fill_value=np.nan)
-
-            for idx, junction_number in enumerate(range(1, number_of_junctions + 1)):
-                odessa_path = (
-                    f"PRIMARY 1: JUNCTION {junction_number}: THER 1: {variable_name} 1"
-                )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {primary_junction_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_primary_junction_geom(
-        odessa_base: pyod.Base, variable_name: str
-    ) -> np.ndarray:
-        """Parse ASTEC variable from primary junction geometric data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(
-            f"Parse ASTEC variable {variable_name}, type primary_junction_geom."
-        )
-
-        primary_junction_check_path = "PRIMARY 1: JUNCTION 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, primary_junction_check_path
-        ):
-            primary = odessa_base.get("PRIMARY")
-            number_of_junctions = primary.len("JUNCTION")
-
-            logger.debug(f"Number of junctions in primary: {number_of_junctions}.")
-
-            array = np.full((number_of_junctions), fill_value=np.nan)
-
-            for idx, junction_number in enumerate(range(1, number_of_junctions + 1)):
-                odessa_path = (
-                    f"PRIMARY 1: JUNCTION {junction_number}: GEOM 1: {variable_name} 1"
-                )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {primary_junction_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_primary_volume_ther(
-        odessa_base: pyod.Base, variable_name: str
-    ) -> np.ndarray:
-        """Parse ASTEC variable from primary volume thermal data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type primary_volume_ther.")
-
-        primary_volume_check_path = "PRIMARY 1: VOLUME 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, primary_volume_check_path
-        ):
-            primary = odessa_base.get("PRIMARY")
-            number_of_volumes = primary.len("VOLUME")
-
-            logger.debug(f"Number of volumes in primary: {number_of_volumes}.")
-
-            array = np.full((number_of_volumes), fill_value=np.nan)
-
-            for idx, volume_number in enumerate(range(1, number_of_volumes + 1)):
-                odessa_path = (
-                    f"PRIMARY 1: VOLUME {volume_number}: THER 1: {variable_name} 1"
-                )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {primary_volume_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_primary_volume_geom(
-        odessa_base: pyod.Base, variable_name: str
-    ) -> np.ndarray:
-        """Parse ASTEC variable from primary volume geometric data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type primary_volume_geom.")
-
-        primary_volume_check_path = "PRIMARY 1: VOLUME 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, primary_volume_check_path
-        ):
-            primary = odessa_base.get("PRIMARY")
-            number_of_volumes = primary.len("VOLUME")
-
-            logger.debug(f"Number of volumes in primary: {number_of_volumes}.")
-
-            array = np.full((number_of_volumes), fill_value=np.nan)
-
-            for idx, volume_number in enumerate(range(1, number_of_volumes + 1)):
-                odessa_path = (
-                    f"PRIMARY 1: VOLUME {volume_number}: GEOM 1: {variable_name} 1"
-                )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {primary_volume_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_primary_pipe_ther(
-        odessa_base: pyod.Base, variable_name: str
-    ) -> np.ndarray:
-        """Parse ASTEC variable from primary pipe thermal data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type primary_pipe_ther.")
-
-        primary_pipe_check_path = "PRIMARY 1: PIPE 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, primary_pipe_check_path
-        ):
-            primary = odessa_base.get("PRIMARY")
-            number_of_pipes = primary.len("PIPE")
-
-            logger.debug(f"Number of pipes in primary: {number_of_pipes}.")
-
-            array = np.full((number_of_pipes), fill_value=np.nan)
-
-            for idx, pipe_number in enumerate(range(1, number_of_pipes + 1)):
-                odessa_path = (
-                    f"PRIMARY 1: PIPE {pipe_number}: THER 1: {variable_name} 1"
-                )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure
-
-        else:
-            logger.debug(
-                f"Path {primary_pipe_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_primary_pipe_geom(
-        odessa_base: pyod.Base, variable_name: str
-    ) -> np.ndarray:
-        """Parse ASTEC variable from primary pipe geometric data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type primary_pipe_geom.")
-
-        primary_pipe_geom_check_path = "PRIMARY 1: PIPE 1: GEOM 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, primary_pipe_geom_check_path
-        ):
-            primary = odessa_base.get("PRIMARY")
-            number_of_pipes = primary.len("PIPE")
-            variable_structure = primary.get(f"PIPE 1: GEOM 1: {variable_name} 1")
-
-            logger.debug(
-                f"Number of pipes in primary: {number_of_pipes}. "
-                f"Length of variable structure: {len(variable_structure)}."
-            )
-
-            array = np.full(
-                (number_of_pipes, len(variable_structure)), fill_value=np.nan
-            )
-
-            for idx, pipe_number in enumerate(range(1, number_of_pipes + 1)):
-                odessa_path = (
-                    f"PRIMARY 1: PIPE {pipe_number}: GEOM 1: {variable_name} 1"
-                )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {primary_pipe_geom_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_secondar_junction_ther(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from secondary junction thermal data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(
-            f"Parse ASTEC variable {variable_name}, type secondar_junction_ther."
-        )
-
-        secondar_junction_check_path = "SECONDAR 1: JUNCTION 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, secondar_junction_check_path
-        ):
-            secondar = odessa_base.get("SECONDAR")
-            number_of_junctions = secondar.len("JUNCTION")
-
-            logger.debug(f"Number of junctions in secondar: {number_of_junctions}.")
-
-            array = np.full((number_of_junctions), fill_value=np.nan)
-
-            for idx, junction_number in enumerate(range(1, number_of_junctions + 1)):
-                odessa_path = (
-                    f"SECONDAR 1: JUNCTION {junction_number}: THER 1: {variable_name} 1"
-                )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {secondar_junction_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
+        return structures[odessa_path]
 
     @staticmethod
-    def parse_variable_from_secondar_junction_geom(
-        odessa_base: pyod.Base, variable_name: str
-    ) -> np.ndarray:
-        """Parse ASTEC variable from secondary junction geometric data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(
-            f"Parse ASTEC variable {variable_name}, type secondar_junction_geom."
-        )
-
-        secondar_junction_check_path = "SECONDAR 1: JUNCTION 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, secondar_junction_check_path
-        ):
-            secondar = odessa_base.get("SECONDAR")
-            number_of_junctions = secondar.len("JUNCTION")
-
-            logger.debug(f"Number of junctions in secondar: {number_of_junctions}.")
-
-            array = np.full((number_of_junctions), fill_value=np.nan)
-
-            for idx, junction_number in enumerate(range(1, number_of_junctions + 1)):
-                odessa_path = (
-                    f"SECONDAR 1: JUNCTION {junction_number}: GEOM 1: {variable_name} 1"
-                )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {secondar_junction_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
+    @lru_cache(maxsize=None)
+    def get_odessa_structure_paths(
+        odessa_path: str,
+        number_of_structures: int,
+        substructure_path: Optional[str] = None,
+    ) -> Tuple[str, ...]:
+        """Get the numbered odessa paths of a structure.
 
-    @staticmethod
-    def parse_variable_from_secondar_volume_ther(
-        odessa_base: pyod.Base, variable_name: str
-    ) -> np.ndarray:
-        """Parse ASTEC variable from secondary volume thermal data.
+        The paths are built once per structure and number of structures and are
+        reused for all variables and time points.
 
         Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
+            odessa_path (str): Path to the structure without number,
+                e.g. "SYSTEMS 1: PUMP".
+            number_of_structures (int): Number of structures.
+            substructure_path (Optional[str]): Path appended to each numbered
+                structure, e.g. "THER 1". Defaults to None.
 
         Returns:
-            np.ndarray: An array containing the parsed variable data.
+            Tuple[str, ...]: The odessa paths from "<odessa_path> 1" to
+            "<odessa_path> <number_of_structures>", each followed by
+            ": <substructure_path>" if given.
 
         """
-        logger.debug(
-            f"Parse ASTEC variable {variable_name}, type secondar_volume_ther."
+        suffix = "" if substructure_path is None else f": {substructure_path}"
+        return tuple(
+            f"{odessa_path} {number}{suffix}"
+            for number in range(1, number_of_structures + 1)
         )
 
-        secondar_volume_check_path = "SECONDAR 1: VOLUME 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, secondar_volume_check_path
-        ):
-            secondar = odessa_base.get("SECONDAR")
-            number_of_volumes = secondar.len("VOLUME")
-
-            logger.debug(f"Number of volumes in secondar: {number_of_volumes}.")
-
-            array = np.full((number_of_volumes), fill_value=np.nan)
-
-            for idx, volume_number in enumerate(range(1, number_of_volumes + 1)):
-                odessa_path = (
-                    f"SECONDAR 1: VOLUME {volume_number}: THER 1: {variable_name} 1"
-                )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {secondar_volume_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
     @staticmethod
-    def parse_variable_from_primary_wall(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from primary wall data.
+    def convert_odessa_structure_to_float(
+        odessa_structure: Union[pyod.R1, float],
+    ) -> float:
+        """Convert an Odessa structure to a float value.
 
         Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
+            odessa_structure: The odessa structure to convert.
 
         Returns:
-            np.ndarray: An array containing the parsed variable data.
+            float: The converted float value, np.nan for an unknown type.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type primary_wall.")
-
-        primary_wall_check_path = "PRIMARY 1: WALL 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, primary_wall_check_path
-        ):
-            primary = odessa_base.get("PRIMARY")
-            number_of_walls = primary.len("WALL")
-
-            logger.debug(f"Number of walls in primary: {number_of_walls}.")
-
-            array = np.full((number_of_walls), fill_value=np.nan)
-
-            for idx, wall_number in enumerate(range(1, number_of_walls + 1)):
-                odessa_path = f"PRIMARY 1: WALL {wall_number}: {variable_name} 1"
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure
+        value = np.nan
 
+        if isinstance(odessa_structure, pyod.R1):
+            value = odessa_structure[0]
+        elif isinstance(odessa_structure, float):
+            value = odessa_structure
         else:
-            logger.debug(
-                f"Path {primary_wall_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
+            logger.error("Unkown type.")
 
-        return array
+        return value
 
-    @staticmethod
-    def parse_variable_from_primary_wall_ther(
+    def parse_variable_vessel_magma_debris(
+        self,
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from primary wall thermal data.
+        """Parse ASTEC variable from magma debris.
 
         Args:
             odessa_base: The odessa base object.
@@ -1411,47 +964,48 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type primary_wall_ther.")
+        logger.debug(
+            "Parse ASTEC variable %s, type vessel_magma_debris.", variable_name
+        )
 
-        primary_wall_check_path = "PRIMARY 1: WALL 1"
+        array = np.full(
+            (len(self.magma_debris_ids.index)), fill_value=np.nan, dtype=np.float32
+        )
+        logger.debug("Initialized array with shape %s.", array.shape)
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, primary_wall_check_path
-        ):
-            primary = odessa_base.get("PRIMARY")
-            number_of_walls = primary.len("WALL")
+        mesh_indices, comp_paths = self.magma_debris_id_arrays[variable_name]
 
-            logger.debug(f"Number of walls in primary: {number_of_walls}.")
+        # Collect the existing values and scatter them into the array at once
+        found_indices, found_values = [], []
+        for mesh_index, comp_path in zip(mesh_indices, comp_paths):
+            logger.debug("Handle mesh_index %s and %s.", mesh_index, comp_path)
 
-            array = np.full((number_of_walls), fill_value=np.nan)
+            comp = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                odessa_base, comp_path
+            )
 
-            for idx, wall_number in enumerate(range(1, number_of_walls + 1)):
-                odessa_path = (
-                    f"PRIMARY 1: WALL {wall_number}: THER 1: {variable_name} 1"
+            variable_structure = (
+                None
+                if comp is None
+                else AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                    comp, "M 1"
                 )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {primary_wall_check_path} not in odessa base, "
-                "fill array with np.nan."
             )
-            array = np.full((1), fill_value=np.nan)
+            if variable_structure is not None:
+                logger.debug("Collect variable structure %s.", variable_structure)
+                found_indices.append(mesh_index)
+                found_values.append(variable_structure)
+
+        array[found_indices] = np.asarray(found_values, dtype=array.dtype)
 
         return array
 
-    @staticmethod
-    def parse_variable_from_primary_wall_ther_2(
+    def parse_variable_vessel_fuel(
+        self,
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from primary wall thermal data (alternative).
+        """Parse ASTEC variable from vessel fuel.
 
         Args:
             odessa_base: The odessa base object.
@@ -1461,47 +1015,43 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type primary_wall_ther_2.")
+        logger.debug("Parse ASTEC variable %s, type vessel_fuel.", variable_name)
 
-        primary_wall_check_path = "PRIMARY 1: WALL 1"
+        array = np.full((len(self.fuel_id_array)), fill_value=np.nan, dtype=np.float32)
+        logger.debug("Initialized array with shape %s.", array.shape)
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, primary_wall_check_path
-        ):
-            primary = odessa_base.get("PRIMARY")
-            number_of_walls = primary.len("WALL")
+        odessa_path = f"{variable_name} 1"
 
-            logger.debug(f"Number of walls in primary: {number_of_walls}.")
+        found_indices, found_values = [], []
+        for idx, comp_path in enumerate(self.fuel_comp_paths):
+            logger.debug("Handle %s.", comp_path)
 
-            array = np.full((number_of_walls), fill_value=np.nan)
+            comp = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                odessa_base, comp_path
+            )
 
-            for idx, wall_number in enumerate(range(1, number_of_walls + 1)):
-                odessa_path = (
-                    f"PRIMARY 1: WALL {wall_number}: THER 2: {variable_name} 1"
+            variable_structure = (
+                None
+                if comp is None
+                else AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                    comp, odessa_path
                 )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {primary_wall_check_path} not in odessa base, "
-                "fill array with np.nan."
             )
-            array = np.full((1), fill_value=np.nan)
+            if variable_structure is not None:
+                logger.debug("Collect variable structure %s.", variable_structure)
+                found_indices.append(idx)
+                found_values.append(variable_structure)
+
+        array[found_indices] = np.asarray(found_values, dtype=array.dtype)
 
         return array
 
-    @staticmethod
-    def parse_variable_from_primary_wall_geom(
+    def parse_variable_vessel_clad(
+        self,
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from primary wall geometric data.
+        """Parse ASTEC variable from vessel clad.
 
         Args:
             odessa_base: The odessa base object.
@@ -1511,95 +1061,43 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type primary_wall_geom.")
+        logger.debug("Parse ASTEC variable %s, type vessel_clad.", variable_name)
 
-        primary_wall_check_path = "PRIMARY 1: WALL 1"
+        array = np.full((len(self.clad_id_array)), fill_value=np.nan, dtype=np.float32)
+        logger.debug("Initialized array with shape %s.", array.shape)
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, primary_wall_check_path
-        ):
-            primary = odessa_base.get("PRIMARY")
-            number_of_walls = primary.len("WALL")
+        odessa_path = f"{variable_name} 1"
 
-            logger.debug(f"Number of walls in primary: {number_of_walls}.")
+        found_indices, found_values = [], []
+        for idx, comp_path in enumerate(self.clad_comp_paths):
+            logger.debug("Handle %s.", comp_path)
 
-            array = np.full((number_of_walls), fill_value=np.nan)
+            comp = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                odessa_base, comp_path
+            )
 
-            for idx, wall_number in enumerate(range(1, number_of_walls + 1)):
-                odessa_path = (
-                    f"PRIMARY 1: WALL {wall_number}: GEOM 1: {variable_name} 1"
+            variable_structure = (
+                None
+                if comp is None
+                else AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                    comp, odessa_path
                 )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {primary_wall_check_path} not in odessa base, "
-                "fill array with np.nan."
             )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
-
-    @staticmethod
-    def parse_variable_from_secondar_wall(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from secondary wall data.
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type secondar_wall.")
-
-        secondar_wall_check_path = "SECONDAR 1: WALL 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, secondar_wall_check_path
-        ):
-            secondar = odessa_base.get("SECONDAR")
-            number_of_walls = secondar.len("WALL")
+            if variable_structure is not None:
+                logger.debug("Collect variable structure %s.", variable_structure)
+                found_indices.append(idx)
+                found_values.append(variable_structure)
 
-            logger.debug(f"Number of walls in secondar: {number_of_walls}.")
-
-            array = np.full((number_of_walls), fill_value=np.nan)
-
-            for idx, wall_number in enumerate(range(1, number_of_walls + 1)):
-                odessa_path = f"SECONDAR 1: WALL {wall_number}: {variable_name} 1"
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure
-
-        else:
-            logger.debug(
-                f"Path {secondar_wall_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
+        array[found_indices] = np.asarray(found_values, dtype=array.dtype)
 
         return array
 
-    @staticmethod
-    def parse_variable_from_secondar_wall_ther(
+    def parse_variable_vessel_fuel_stat(
+        self,
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from secondary wall thermal data.
+        """Parse ASTEC variable from vessel fuel status.
 
         Args:
             odessa_base: The odessa base object.
@@ -1609,97 +1107,50 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type secondar_wall_ther.")
+        logger.debug("Parse ASTEC variable %s, type vessel_fuel_stat.", variable_name)
 
-        secondar_wall_check_path = "SECONDAR 1: WALL 1"
+        array = np.full((len(self.fuel_id_array)), fill_value=np.nan, dtype=np.float32)
+        logger.debug("Initialized array with shape %s.", array.shape)
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, secondar_wall_check_path
-        ):
-            secondar = odessa_base.get("SECONDAR")
-            number_of_walls = secondar.len("WALL")
+        odessa_path = f"{variable_name} 1"
 
-            logger.debug(f"Number of walls in secondar: {number_of_walls}.")
+        found_indices, found_values = [], []
+        for idx, comp_path in enumerate(self.fuel_comp_paths):
+            logger.debug("Handle %s.", comp_path)
 
-            array = np.full((number_of_walls), fill_value=np.nan)
+            comp = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                odessa_base, comp_path
+            )
 
-            for idx, wall_number in enumerate(range(1, number_of_walls + 1)):
-                odessa_path = (
-                    f"SECONDAR 1: WALL {wall_number}: THER 1: {variable_name} 1"
+            variable_structure = (
+                None
+                if comp is None
+                else AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                    comp, odessa_path
                 )
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {secondar_wall_check_path} not in odessa base, "
-                "fill array with np.nan."
             )
-            array = np.full((1), fill_value=np.nan)
-
-        return array
+            if variable_structure is not None:
+                component_state_code = self.component_state_codes[variable_structure]
 
-    @staticmethod
-    def parse_variable_from_secondar_wall_ther_2(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from secondary wall thermal data (alternative).
-
-        Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
-
-        Returns:
-            np.ndarray: An array containing the parsed variable data.
-
-        """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type secondar_wall_ther.")
-
-        secondar_wall_check_path = "SECONDAR 1: WALL 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, secondar_wall_check_path
-        ):
-            secondar = odessa_base.get("SECONDAR")
-            number_of_walls = secondar.len("WALL")
-
-            logger.debug(f"Number of walls in secondar: {number_of_walls}.")
-
-            array = np.full((number_of_walls), fill_value=np.nan)
-
-            for idx, wall_number in enumerate(range(1, number_of_walls + 1)):
-                odessa_path = (
-                    f"SECONDAR 1: WALL {wall_number}: THER 2: {variable_name} 1"
+                logger.debug(
+                    "Collect variable structure string %s, what corresponds to "
+                    "code %s.",
+                    variable_structure,
+                    component_state_code,
                 )
+                found_indices.append(idx)
+                found_values.append(component_state_code)
 
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {secondar_wall_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
+        array[found_indices] = np.asarray(found_values, dtype=array.dtype)
 
         return array
 
-    @staticmethod
-    def parse_variable_from_secondar_wall_geom(
+    def parse_variable_vessel_clad_stat(
+        self,
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from secondary wall geometric data.
+        """Parse ASTEC variable from vessel clad status.
 
         Args:
             odessa_base: The odessa base object.
@@ -1709,178 +1160,183 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type secondar_wall_geom.")
+        logger.debug("Parse ASTEC variable %s, type vessel_clad_stat.", variable_name)
 
-        secondar_wall_check_path = "SECONDAR 1: WALL 1"
+        array = np.full((len(self.clad_id_array)), fill_value=np.nan, dtype=np.float32)
+        logger.debug("Initialized array with shape %s.", array.shape)
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, secondar_wall_check_path
-        ):
-            secondar = odessa_base.get("SECONDAR")
-            number_of_walls = secondar.len("WALL")
+        odessa_path = f"{variable_name} 1"
 
-            logger.debug(f"Number of walls in secondar: {number_of_walls}.")
+        found_indices, found_values = [], []
+        for idx, comp_path in enumerate(self.clad_comp_paths):
+            logger.debug("Handle %s.", comp_path)
 
-            array = np.full((number_of_walls), fill_value=np.nan)
+            comp = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                odessa_base, comp_path
+            )
 
-            for idx, wall_number in enumerate(range(1, number_of_walls + 1)):
-                odessa_path = (
-                    f"SECONDAR 1: WALL {wall_number}: GEOM 1: {variable_name} 1"
+            variable_structure = (
+                None
+                if comp is None
+                else AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                    comp, odessa_path
                 )
+            )
+            if variable_structure is not None:
+                component_state_code = self.component_state_codes[variable_structure]
 
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
+                logger.debug(
+                    "Collect variable structure string %s, what corresponds to "
+                    "code %s.",
+                    variable_structure,
+                    component_state_code,
+                )
+                found_indices.append(idx)
+                found_values.append(component_state_code)
 
-        else:
-            logger.debug(
-                f"Path {secondar_wall_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
+        array[found_indices] = np.asarray(found_values, dtype=array.dtype)
 
         return array
 
     @staticmethod
-    def parse_variable_from_systems_pump(
-        odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from systems pump data.
+    def get_structure_parser(strategy: str) -> Callable[..., np.ndarray]:
+        """Get the parser of a strategy defined in STRUCTURE_PARSER_SPECS.
 
         Args:
-            odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
+            strategy (str): Name of the strategy.
 
         Returns:
-            np.ndarray: An array containing the parsed variable data.
+            Callable[..., np.ndarray]: parse_variable_from_structures bound to the
+            specification of the strategy.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type systems_pump.")
-
-        systems_pump_check_path = "SYSTEMS 1: PUMP 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, systems_pump_check_path
-        ):
-            systems = odessa_base.get("SYSTEMS")
-            number_of_pumps = systems.len("PUMP")
-
-            logger.debug(f"Number of pumps in systems: {number_of_pumps}.")
-
-            array = np.full((number_of_pumps), fill_value=np.nan)
-
-            for idx, pump_number in enumerate(range(1, number_of_pumps + 1)):
-                odessa_path = f"SYSTEMS 1: PUMP {pump_number}: {variable_name} 1"
-
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
-
-        else:
-            logger.debug(
-                f"Path {systems_pump_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
+        container_path, structure_name, substructure_path, first_value = (
+            STRUCTURE_PARSER_SPECS[strategy]
+        )
 
-        return array
+        return partial(
+            AssasOdessaNetCDF4Converter.parse_variable_from_structures,
+            container_path=container_path,
+            structure_name=structure_name,
+            substructure_path=substructure_path,
+            first_value=first_value,
+        )
 
     @staticmethod
-    def parse_variable_from_systems_valve(
+    def parse_variable_from_structures(
         odessa_base: pyod.Base,
         variable_name: str,
+        container_path: Optional[str],
+        structure_name: str,
+        substructure_path: Optional[str] = None,
+        first_value: bool = True,
     ) -> np.ndarray:
-        """Parse ASTEC variable from systems valve data.
+        """Parse ASTEC variable from all numbered structures of a container.
 
         Args:
             odessa_base: The odessa base object.
             variable_name (str): Name of the variable to parse.
+            container_path (Optional[str]): Path to the container, e.g. "PRIMARY 1".
+                None if the structures belong to the odessa base itself.
+            structure_name (str): Name of the numbered structures, e.g. "VOLUME".
+            substructure_path (Optional[str]): Path from a structure to the
+                substructure holding the variable, e.g. "THER 1". None if the
+                variable belongs to the structure itself.
+            first_value (bool): If True, the first value of the variable structure
+                is stored, otherwise the variable structure itself.
 
         Returns:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type systems_valve.")
-
-        systems_valve_check_path = "SYSTEMS 1: VALVE 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, systems_valve_check_path
-        ):
-            systems = odessa_base.get("SYSTEMS")
-            number_of_valves = systems.len("VALVE")
-
-            logger.debug(f"Number of valves in systems: {number_of_valves}.")
-
-            array = np.full((number_of_valves), fill_value=np.nan)
-
-            for idx, valve_number in enumerate(range(1, number_of_valves + 1)):
-                odessa_path = f"SYSTEMS 1: VALVE {valve_number}: {variable_name} 1"
+        logger.debug(
+            "Parse ASTEC variable %s from %s of %s.",
+            variable_name,
+            structure_name,
+            container_path,
+        )
 
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
+        number_of_structures = (
+            AssasOdessaNetCDF4Converter.get_cached_number_of_structures(
+                odessa_base, container_path, structure_name
+            )
+        )
 
-        else:
+        if number_of_structures == 0:
             logger.debug(
-                f"Path {systems_valve_check_path} not in odessa base, "
-                "fill array with np.nan."
+                "No %s in %s of odessa base, fill array with np.nan.",
+                structure_name,
+                container_path,
             )
-            array = np.full((1), fill_value=np.nan)
+            return np.full((1), fill_value=np.nan, dtype=np.float32)
 
-        return array
+        logger.debug("Number of %s: %s.", structure_name, number_of_structures)
+
+        # Full paths from the odessa base, so that the (sub)structures are
+        # cached and shared by all variables of the same structures
+        if container_path is not None:
+            structure_name = f"{container_path}: {structure_name}"
+        structure_paths = AssasOdessaNetCDF4Converter.get_odessa_structure_paths(
+            structure_name, number_of_structures, substructure_path
+        )
+
+        # The number of values is known, so the array is filled in one pass
+        return np.fromiter(
+            AssasOdessaNetCDF4Converter.iterate_structure_values(
+                odessa_base, structure_paths, f"{variable_name} 1", first_value
+            ),
+            dtype=np.float32,
+            count=number_of_structures,
+        )
 
     @staticmethod
-    def parse_variable_from_sensor(
+    def iterate_structure_values(
         odessa_base: pyod.Base,
-        variable_name: str,
-    ) -> np.ndarray:
-        """Parse ASTEC variable from sensor data.
+        structure_paths: Tuple[str, ...],
+        variable_key: str,
+        first_value: bool = True,
+    ) -> Iterator[float]:
+        """Iterate over the values of a variable in numbered structures.
+
+        The structures are taken from the structure cache of the odessa base,
+        so only the variable itself is read for each structure.
 
         Args:
             odessa_base: The odessa base object.
-            variable_name (str): Name of the variable to parse.
+            structure_paths (Tuple[str, ...]): Paths of the structures holding the
+                variable, e.g. "VESSEL 1: MESH 1: THER 1".
+            variable_key (str): Key of the variable in a structure, e.g. "P 1".
+            first_value (bool): If True, the first value of the variable structure
+                is returned, otherwise the variable structure itself.
 
         Returns:
-            np.ndarray: An array containing the parsed variable data.
+            Iterator[float]: The value of each structure, np.nan if the variable
+            does not exist in the structure.
 
         """
-        logger.debug(f"Parse ASTEC variable from sensor {variable_name}, type sensor.")
-
-        odessa_path = f"SENSOR {variable_name}: value 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, odessa_path
-        ):
-            variable_structure = odessa_base.get(odessa_path)
-            logger.debug(f"Collect variable structure {variable_structure}.")
-            array = np.array([variable_structure])
-
-        else:
-            logger.debug(
-                f"Variable {variable_name} not in odessa base, "
-                "fill datapoint with np.nan."
+        for structure_path in structure_paths:
+            structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                odessa_base, structure_path
             )
-            array = np.array([np.nan])
-
-        return array
+            variable_structure = (
+                None
+                if structure is None
+                else AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                    structure, variable_key
+                )
+            )
+            if variable_structure is None:
+                yield np.nan
+            else:
+                logger.debug("Collect variable structure %s.", variable_structure)
+                yield variable_structure[0] if first_value else variable_structure
 
     @staticmethod
-    def parse_variable_from_containment_dome(
+    def parse_variable_from_vessel_general(
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from containment dome data.
+        """Parse ASTEC variable from vessel general data.
 
         Args:
             odessa_base: The odessa base object.
@@ -1890,34 +1346,32 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(
-            f"Parse ASTEC variable from sensor {variable_name}, type containment_dome."
-        )
+        logger.debug("Parse ASTEC variable %s, type vessel_general.", variable_name)
 
-        odessa_path = f"CONTAINM 1: ZONE 10: THER 1: {variable_name} 1"
+        odessa_path = f"VESSEL 1: GENERAL 1: {variable_name} 1"
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
+        variable_structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
             odessa_base, odessa_path
-        ):
-            variable_structure = odessa_base.get(odessa_path)
-            logger.debug(f"Collect variable structure {variable_structure}.")
-            array = np.array([variable_structure[0]])
+        )
+        if variable_structure is not None:
+            logger.debug("Collect variable structure %s.", variable_structure)
+            array = np.array([variable_structure], dtype=np.float32)
 
         else:
             logger.debug(
-                f"Variable {variable_name} not in odessa base, "
-                "fill datapoint with np.nan."
+                "Variable %s not in odessa base, fill datapoint with np.nan.",
+                variable_name,
             )
-            array = np.array([np.nan])
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
     @staticmethod
-    def parse_variable_from_containment_pool(
+    def parse_variable_from_fp_heat_vessel(
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from containment pool data.
+        """Parse ASTEC variable from fuel pin heat vessel data.
 
         Args:
             odessa_base: The odessa base object.
@@ -1927,34 +1381,31 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(
-            f"Parse ASTEC variable from sensor {variable_name}, type containment_pool."
-        )
+        logger.debug("Parse ASTEC variable %s, type fp_heat_vessel.", variable_name)
 
-        odessa_path = f"CONTAINM 1: ZONE 11: THER 1: {variable_name} 1"
+        odessa_path = f"FP_HEAT 1: VESSEL 1: {variable_name} 1"
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
+        variable_structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
             odessa_base, odessa_path
-        ):
-            variable_structure = odessa_base.get(odessa_path)
-            logger.debug(f"Collect variable structure {variable_structure}.")
-            array = np.array([variable_structure[0]])
+        )
+        if variable_structure is not None:
+            logger.debug("Collect variable structure %s.", variable_structure)
+            array = np.array([variable_structure[0]], dtype=np.float32)
 
         else:
             logger.debug(
-                f"Variable {variable_name} not in odessa base, "
-                "fill datapoint with np.nan."
+                "Variable %s not in odessa base, fill datapoint with np.nan.",
+                variable_name,
             )
-            array = np.array([np.nan])
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
     @staticmethod
-    def parse_variable_from_containment_zone(
-        odessa_base: pyod.Base,
-        variable_name: str,
+    def parse_variable_from_primary_pipe_geom(
+        odessa_base: pyod.Base, variable_name: str
     ) -> np.ndarray:
-        """Parse ASTEC variable from all containment zones.
+        """Parse ASTEC variable from primary pipe geometric data.
 
         Args:
             odessa_base: The odessa base object.
@@ -1964,45 +1415,59 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type containment_.")
-
-        secondar_wall_check_path = "CONTAINM 1: ZONE 1"
+        logger.debug("Parse ASTEC variable %s, type primary_pipe_geom.", variable_name)
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, secondar_wall_check_path
-        ):
-            containment = odessa_base.get("CONTAINM")
-            number_of_zones = containment.len("ZONE")
+        primary = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+            odessa_base, "PRIMARY 1"
+        )
+        number_of_pipes = 0 if primary is None else primary.len("PIPE")
 
-            logger.debug(f"Number of zones in containment: {number_of_zones}.")
+        variable_path = f": GEOM 1: {variable_name} 1"
+        pipe_paths = AssasOdessaNetCDF4Converter.get_odessa_structure_paths(
+            "PIPE", number_of_pipes
+        )
+        variable_structures = [
+            AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                primary, pipe_path + variable_path
+            )
+            for pipe_path in pipe_paths
+        ]
 
-            array = np.full((number_of_zones), fill_value=np.nan)
+        if len(variable_structures) > 0 and variable_structures[0] is not None:
+            # The structure of the first pipe gives the width of the array,
+            # it is read together with the others instead of in an extra probe
+            logger.debug(
+                "Number of pipes in primary: %s. Length of variable structure: %s.",
+                number_of_pipes,
+                len(variable_structures[0]),
+            )
 
-            for idx, zone_number in enumerate(range(1, number_of_zones + 1)):
-                odessa_path = f"CONTAINM 1: ZONE {zone_number}: {variable_name} 1"
+            array = np.full(
+                (number_of_pipes, len(variable_structures[0])),
+                fill_value=np.nan,
+                dtype=np.float32,
+            )
 
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
+            for idx, variable_structure in enumerate(variable_structures):
+                if variable_structure is not None:
+                    logger.debug("Collect variable structure %s.", variable_structure)
                     array[idx] = variable_structure[0]
 
         else:
             logger.debug(
-                f"Path {secondar_wall_check_path} not in odessa base, "
-                "fill array with np.nan."
+                "Variable %s not in PRIMARY 1: PIPE 1: GEOM 1, fill array with np.nan.",
+                variable_name,
             )
-            array = np.full((1), fill_value=np.nan)
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
     @staticmethod
-    def parse_variable_from_containment_zone_ther(
+    def parse_variable_from_sensor(
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from all containment zone thermal structures.
+        """Parse ASTEC variable from sensor data.
 
         Args:
             odessa_base: The odessa base object.
@@ -2012,47 +1477,32 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type containment_.")
-
-        secondar_wall_check_path = "CONTAINM 1: ZONE 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, secondar_wall_check_path
-        ):
-            containment = odessa_base.get("CONTAINM")
-            number_of_zones = containment.len("ZONE")
-
-            logger.debug(f"Number of zones in containment: {number_of_zones}.")
+        logger.debug("Parse ASTEC variable from sensor %s, type sensor.", variable_name)
 
-            array = np.full((number_of_zones), fill_value=np.nan)
-
-            for idx, zone_number in enumerate(range(1, number_of_zones + 1)):
-                odessa_path = (
-                    f"CONTAINM 1: ZONE {zone_number}: THER 1: {variable_name} 1"
-                )
+        odessa_path = f"SENSOR {variable_name}: value 1"
 
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
+        variable_structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+            odessa_base, odessa_path
+        )
+        if variable_structure is not None:
+            logger.debug("Collect variable structure %s.", variable_structure)
+            array = np.array(variable_structure, dtype=np.float32, ndmin=1)
 
         else:
             logger.debug(
-                f"Path {secondar_wall_check_path} not in odessa base, "
-                "fill array with np.nan."
+                "Variable %s not in odessa base, fill datapoint with np.nan.",
+                variable_name,
             )
-            array = np.full((1), fill_value=np.nan)
+            array = np.full(1, np.nan, dtype=np.float32)
 
         return array
 
     @staticmethod
-    def parse_variable_from_containment_conn(
+    def parse_variable_from_containment_dome(
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from all containment connections.
+        """Parse ASTEC variable from containment dome data.
 
         Args:
             odessa_base: The odessa base object.
@@ -2063,50 +1513,33 @@ class AssasOdessaNetCDF4Converter:
 
         """
         logger.debug(
-            f"Parse ASTEC variable {variable_name}, type containment_connection."
+            "Parse ASTEC variable from sensor %s, type containment_dome.", variable_name
         )
 
-        containment_zone_check_path = "CONTAINM 1: CONN 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, containment_zone_check_path
-        ):
-            containment = odessa_base.get("CONTAINM")
-            number_of_connections = containment.len("CONN")
-
-            logger.debug(
-                f"Number of connections in containment: {number_of_connections}."
-            )
-
-            array = np.full((number_of_connections), fill_value=np.nan)
-
-            for idx, connection_number in enumerate(
-                range(1, number_of_connections + 1)
-            ):
-                odessa_path = f"CONTAINM 1: CONN {connection_number}: {variable_name} 1"
+        odessa_path = f"CONTAINM 1: ZONE 10: THER 1: {variable_name} 1"
 
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
+        variable_structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+            odessa_base, odessa_path
+        )
+        if variable_structure is not None:
+            logger.debug("Collect variable structure %s.", variable_structure)
+            array = np.array([variable_structure[0]], dtype=np.float32)
 
         else:
             logger.debug(
-                f"Path {containment_zone_check_path} not in odessa base, "
-                "fill array with np.nan."
+                "Variable %s not in odessa base, fill datapoint with np.nan.",
+                variable_name,
             )
-            array = np.full((1), fill_value=np.nan)
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
     @staticmethod
-    def parse_variable_from_containment_wall_temp(
+    def parse_variable_from_containment_pool(
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from containment wall temperature profile.
+        """Parse ASTEC variable from containment pool data.
 
         Args:
             odessa_base: The odessa base object.
@@ -2117,48 +1550,33 @@ class AssasOdessaNetCDF4Converter:
 
         """
         logger.debug(
-            f"Parse ASTEC variable {variable_name}, type containment_wall_temperature."
+            "Parse ASTEC variable from sensor %s, type containment_pool.", variable_name
         )
 
-        containment_zone_check_path = f"CONTAINM 1: WALL 1: SLAB 1: {variable_name} 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, containment_zone_check_path
-        ):
-            containment = odessa_base.get("CONTAINM")
-            number_of_walls = containment.len("WALL")
-
-            logger.debug(f"Number of walls in containment: {number_of_walls}.")
-
-            array = np.full((number_of_walls, 21), fill_value=np.nan)
-
-            for idx, wall_number in enumerate(range(1, number_of_walls + 1)):
-                odessa_path = (
-                    f"CONTAINM 1: WALL {wall_number}: SLAB 1: {variable_name} 1"
-                )
+        odessa_path = f"CONTAINM 1: ZONE 11: THER 1: {variable_name} 1"
 
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure
+        variable_structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+            odessa_base, odessa_path
+        )
+        if variable_structure is not None:
+            logger.debug("Collect variable structure %s.", variable_structure)
+            array = np.array([variable_structure[0]], dtype=np.float32)
 
         else:
             logger.debug(
-                f"Path {containment_zone_check_path} not in odessa base, "
-                "fill array with np.nan."
+                "Variable %s not in odessa base, fill datapoint with np.nan.",
+                variable_name,
             )
-            array = np.full((1, 1), fill_value=np.nan)
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
     @staticmethod
-    def parse_variable_from_connecti(
+    def parse_variable_from_containment_wall_temp(
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from connecti data.
+        """Parse ASTEC variable from containment wall temperature profile.
 
         Args:
             odessa_base: The odessa base object.
@@ -2168,48 +1586,60 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type connecti.")
+        logger.debug(
+            "Parse ASTEC variable %s, type containment_wall_temperature.", variable_name
+        )
 
-        connecti_check_path = "CONNECTI 1"
+        containment_zone_check_path = f"CONTAINM 1: WALL 1: SLAB 1: {variable_name} 1"
 
         if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, connecti_check_path
+            odessa_base, containment_zone_check_path
         ):
-            number_of_connectis = odessa_base.len("CONNECTI")
+            number_of_walls = (
+                AssasOdessaNetCDF4Converter.get_cached_number_of_structures(
+                    odessa_base, "CONTAINM 1", "WALL"
+                )
+            )
 
-            logger.debug(f"Number of valves in systems: {number_of_connectis}.")
+            logger.debug("Number of walls in containment: %s.", number_of_walls)
 
-            array = np.full((number_of_connectis), fill_value=np.nan)
+            array = np.full((number_of_walls, 21), fill_value=np.nan, dtype=np.float32)
 
-            for idx, connecti_number in enumerate(range(1, number_of_connectis + 1)):
-                odessa_path = f"CONNECTI {connecti_number}: {variable_name} 1"
+            variable_key = f"{variable_name} 1"
+            slab_paths = AssasOdessaNetCDF4Converter.get_odessa_structure_paths(
+                "CONTAINM 1: WALL", number_of_walls, "SLAB 1"
+            )
 
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = (
-                        AssasOdessaNetCDF4Converter.convert_odessa_structure_to_float(
-                            odessa_structure=variable_structure
-                        )
+            for idx, slab_path in enumerate(slab_paths):
+                slab = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                    odessa_base, slab_path
+                )
+                variable_structure = (
+                    None
+                    if slab is None
+                    else AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                        slab, variable_key
                     )
+                )
+                if variable_structure is not None:
+                    logger.debug("Collect variable structure %s.", variable_structure)
+                    array[idx] = variable_structure
 
         else:
             logger.debug(
-                f"Path {connecti_check_path} nnot in odessa base, "
-                "fill array with np.nan."
+                "Path %s not in odessa base, fill array with np.nan.",
+                containment_zone_check_path,
             )
-            array = np.full((1), fill_value=np.nan)
+            array = np.full((1, 1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
     @staticmethod
-    def parse_variable_from_connecti_heat(
+    def parse_variable_from_connecti(
         odessa_base: pyod.Base,
         variable_name: str,
     ) -> np.ndarray:
-        """Parse ASTEC variable from connecti heat data.
+        """Parse ASTEC variable from connecti data.
 
         Args:
             odessa_base: The odessa base object.
@@ -2219,35 +1649,53 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type connecti_heat.")
+        logger.debug("Parse ASTEC variable %s, type connecti.", variable_name)
 
         connecti_check_path = "CONNECTI 1"
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, connecti_check_path
-        ):
-            number_of_connectis = odessa_base.len("CONNECTI")
+        number_of_connectis = (
+            AssasOdessaNetCDF4Converter.get_cached_number_of_structures(
+                odessa_base, None, "CONNECTI"
+            )
+        )
 
-            logger.debug(f"Number of valves in systems: {number_of_connectis}.")
+        if number_of_connectis > 0:
+            logger.debug("Number of connectis: %s.", number_of_connectis)
 
-            array = np.full((number_of_connectis), fill_value=np.nan)
+            array = np.full((number_of_connectis), fill_value=np.nan, dtype=np.float32)
 
-            for idx, connecti_number in enumerate(range(1, number_of_connectis + 1)):
-                odessa_path = f"CONNECTI {connecti_number}: HEAT 1: {variable_name} 1"
+            variable_key = f"{variable_name} 1"
+            connecti_paths = AssasOdessaNetCDF4Converter.get_odessa_structure_paths(
+                "CONNECTI", number_of_connectis
+            )
 
-                if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                    odessa_base, odessa_path
-                ):
-                    variable_structure = odessa_base.get(odessa_path)
-                    logger.debug(f"Collect variable structure {variable_structure}.")
-                    array[idx] = variable_structure[0]
+            for idx, connecti_path in enumerate(connecti_paths):
+                connecti = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                    odessa_base, connecti_path
+                )
+                variable_structure = (
+                    None
+                    if connecti is None
+                    else AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                        connecti, variable_key
+                    )
+                )
+                if variable_structure is None:
+                    continue
+
+                logger.debug("Collect variable structure %s.", variable_structure)
+                array[idx] = (
+                    AssasOdessaNetCDF4Converter.convert_odessa_structure_to_float(
+                        variable_structure
+                    )
+                )
 
         else:
             logger.debug(
-                f"Path {connecti_check_path} not in odessa base, "
-                "fill array with np.nan."
+                "Path %s not in odessa base, fill array with np.nan.",
+                connecti_check_path,
             )
-            array = np.full((1), fill_value=np.nan)
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
@@ -2266,57 +1714,71 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type connecti_source.")
-
-        connecti_source_check_path = "CONNECTI 1: SOURCE 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, connecti_source_check_path
-        ):
-            number_of_connectis = odessa_base.len("CONNECTI")
+        logger.debug("Parse ASTEC variable %s, type connecti_source.", variable_name)
 
-            overall_shape = 0
-            for connecti_number in range(1, number_of_connectis + 1):
-                connecti_object = odessa_base.get(f"CONNECTI {connecti_number}")
-                number_of_sources = connecti_object.len("SOURCE")
-                for source_number in range(1, number_of_sources + 1):
-                    overall_shape += 1
+        connecti_sources = AssasOdessaNetCDF4Converter.get_connecti_sources(odessa_base)
 
+        if len(connecti_sources) == 0 or len(connecti_sources[0]) == 0:
             logger.debug(
-                f"Number of valves in systems: {number_of_connectis}."
-                f" Complete shape {overall_shape}."
+                "No SOURCE in CONNECTI 1 of odessa base, fill array with np.nan."
             )
+            return np.full((1), fill_value=np.nan, dtype=np.float32)
 
-            array = np.full((overall_shape), fill_value=np.nan)
+        overall_shape = sum(len(source_paths) for source_paths in connecti_sources)
+        logger.debug(
+            "Number of connectis: %s. Complete shape %s.",
+            len(connecti_sources),
+            overall_shape,
+        )
 
-            index = 0
-            for _, connecti_number in enumerate(range(1, number_of_connectis + 1)):
-                connecti_object = odessa_base.get(f"CONNECTI {connecti_number}")
-                number_of_sources = connecti_object.len("SOURCE")
+        variable_key = f"{variable_name} 1"
 
-                for _, source_number in enumerate(range(1, number_of_sources + 1)):
-                    odessa_path = f"CONNECTI {connecti_number}:"
-                    odessa_path += f" SOURCE {source_number}: {variable_name} 1"
+        return np.fromiter(
+            chain.from_iterable(
+                AssasOdessaNetCDF4Converter.iterate_structure_values(
+                    odessa_base, source_paths, variable_key, first_value=False
+                )
+                for source_paths in connecti_sources
+            ),
+            dtype=np.float32,
+            count=overall_shape,
+        )
 
-                    if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                        odessa_base, odessa_path
-                    ):
-                        variable_structure = odessa_base.get(odessa_path)
-                        logger.debug(
-                            f"Collect variable structure {variable_structure}."
-                        )
-                        array[index] = variable_structure
+    @staticmethod
+    def get_connecti_sources(
+        odessa_base: pyod.Base,
+    ) -> List[Tuple[str, ...]]:
+        """Get the paths of the sources of each connecti of the odessa base.
 
-                    index += 1
+        The connectis are taken from the structure cache of the odessa base, the
+        sources are cached when they are read by their full paths.
 
-        else:
-            logger.debug(
-                f"Path {connecti_source_check_path} not in odessa base, "
-                "fill array with np.nan."
+        Args:
+            odessa_base: The odessa base object.
+
+        Returns:
+            List[Tuple[str, ...]]: For each connecti the paths of its sources,
+            e.g. ("CONNECTI 1: SOURCE 1", ...).
+
+        """
+        connecti_paths = AssasOdessaNetCDF4Converter.get_odessa_structure_paths(
+            "CONNECTI",
+            AssasOdessaNetCDF4Converter.get_cached_number_of_structures(
+                odessa_base, None, "CONNECTI"
+            ),
+        )
+
+        connecti_sources = []
+        for connecti_path in connecti_paths:
+            source_paths = AssasOdessaNetCDF4Converter.get_odessa_structure_paths(
+                f"{connecti_path}: SOURCE",
+                AssasOdessaNetCDF4Converter.get_cached_number_of_structures(
+                    odessa_base, connecti_path, "SOURCE"
+                ),
             )
-            array = np.full((1), fill_value=np.nan)
+            connecti_sources.append(source_paths)
 
-        return array
+        return connecti_sources
 
     @staticmethod
     def parse_variable_from_connecti_source_index(
@@ -2336,55 +1798,48 @@ class AssasOdessaNetCDF4Converter:
 
         """
         logger.debug(
-            f"Parse ASTEC variable {variable_name}, "
-            f"type connecti_source_index. Index: {index}"
+            "Parse ASTEC variable %s, type connecti_source_index. Index: %s",
+            variable_name,
+            index,
         )
 
-        connecti_source_check_path = "CONNECTI 1: SOURCE 1"
-
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base, connecti_source_check_path
-        ):
-            number_of_connectis = odessa_base.len("CONNECTI")
-
-            overall_shape = 0
-            for connecti_number in range(1, number_of_connectis + 1):
-                connecti_object = odessa_base.get(f"CONNECTI {connecti_number}")
-                number_of_sources = connecti_object.len("SOURCE")
-                for source_number in range(1, number_of_sources + 1):
-                    overall_shape += 1
+        connecti_sources = AssasOdessaNetCDF4Converter.get_connecti_sources(odessa_base)
 
+        if len(connecti_sources) == 0 or len(connecti_sources[0]) == 0:
             logger.debug(
-                f"Number of valves in systems: {number_of_connectis}. "
-                f"Complete shape {overall_shape}."
+                "No SOURCE in CONNECTI 1 of odessa base, fill array with np.nan."
             )
+            return np.full((1), fill_value=np.nan, dtype=np.float32)
 
-            array = np.full((overall_shape), fill_value=np.nan)
-
-            index = 0
-            for _, connecti_number in enumerate(range(1, number_of_connectis + 1)):
-                connecti_object = odessa_base.get(f"CONNECTI {connecti_number}")
-                number_of_sources = connecti_object.len("SOURCE")
+        overall_shape = sum(len(source_paths) for source_paths in connecti_sources)
+        logger.debug(
+            "Number of connectis: %s. Complete shape %s.",
+            len(connecti_sources),
+            overall_shape,
+        )
 
-                for _, source_number in enumerate(range(1, number_of_sources + 1)):
-                    odessa_path = f"CONNECTI {connecti_number}:"
-                    odessa_path += f" SOURCE {source_number}: {variable_name} 1"
+        array = np.full((overall_shape), fill_value=np.nan, dtype=np.float32)
 
-                    if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-                        odessa_base, odessa_path
-                    ):
-                        variable_structure = odessa_base.get(odessa_path)
-                        logger.debug(
-                            f"Collect variable structure {variable_structure}."
-                        )
-                        array[index] = variable_structure[index]
+        # One entry per source, each holding the requested value of the source
+        variable_key = f"{variable_name} 1"
+        source_index = 0
+        for source_paths in connecti_sources:
+            for source_path in source_paths:
+                source = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                    odessa_base, source_path
+                )
+                variable_structure = (
+                    None
+                    if source is None
+                    else AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                        source, variable_key
+                    )
+                )
+                if variable_structure is not None:
+                    logger.debug("Collect variable structure %s.", variable_structure)
+                    array[source_index] = variable_structure[index]
 
-        else:
-            logger.debug(
-                f"Path {connecti_source_check_path} not in odessa base, "
-                "fill array with np.nan."
-            )
-            array = np.full((1), fill_value=np.nan)
+                source_index += 1
 
         return array
 
@@ -2404,24 +1859,24 @@ class AssasOdessaNetCDF4Converter:
 
         """
         logger.debug(
-            f"Parse ASTEC variable from connecti source {variable_name}, "
-            "type connecti_source_fp."
+            "Parse ASTEC variable from connecti source %s, type connecti_source_fp.",
+            variable_name,
         )
 
         odessa_path = f"CONNECTI 1: SOURCE {variable_name}: QMAV 1"
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
+        variable_structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
             odessa_base, odessa_path
-        ):
-            variable_structure = odessa_base.get(odessa_path)
-            logger.debug(f"Collect variable structure {variable_structure}.")
-            array = np.array([variable_structure])
+        )
+        if variable_structure is not None:
+            logger.debug("Collect variable structure %s.", variable_structure)
+            array = np.array([variable_structure], dtype=np.float32)
 
         else:
             logger.debug(
-                f"Variable {variable_name} not in odessa base, fill array with np.nan."
+                "Variable %s not in odessa base, fill array with np.nan.", variable_name
             )
-            array = np.array([np.nan])
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
@@ -2440,23 +1895,22 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type vessel_trup.")
+        logger.debug("Parse ASTEC variable %s, type vessel_trup.", variable_name)
 
         odessa_path = f"SEQUENCE 1: {variable_name} 1"
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
-            odessa_base=odessa_base,
-            odessa_path=odessa_path,
-        ):
-            variable_structure = odessa_base.get(odessa_path)
-            logger.debug(f"Collect variable structure {variable_structure}.")
-            array = np.array([variable_structure])
+        variable_structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+            odessa_base, odessa_path
+        )
+        if variable_structure is not None:
+            logger.debug("Collect variable structure %s.", variable_structure)
+            array = np.array([variable_structure], dtype=np.float32)
 
         else:
             logger.debug(
-                f"Variable {variable_name} not in odessa base, fill array with np.nan."
+                "Variable %s not in odessa base, fill array with np.nan.", variable_name
             )
-            array = np.array([np.nan])
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
@@ -2475,22 +1929,24 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type private_assas_param.")
+        logger.debug(
+            "Parse ASTEC variable %s, type private_assas_param.", variable_name
+        )
 
         odessa_path = f"PRIVATE 1: ASSASpar 1: {variable_name} 1"
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
+        variable_structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
             odessa_base, odessa_path
-        ):
-            variable_structure = odessa_base.get(odessa_path)
-            logger.debug(f"Collect variable structure {variable_structure}.")
-            array = np.array([variable_structure])
+        )
+        if variable_structure is not None:
+            logger.debug("Collect variable structure %s.", variable_structure)
+            array = np.array([variable_structure], dtype=np.float32)
 
         else:
             logger.debug(
-                f"Variable {variable_name} not in odessa base, fill array with np.nan."
+                "Variable %s not in odessa base, fill array with np.nan.", variable_name
             )
-            array = np.array([np.nan])
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
@@ -2509,22 +1965,22 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type cesar_io.")
+        logger.debug("Parse ASTEC variable %s, type cesar_io.", variable_name)
 
         odessa_path = f"CESAR_IO 1: {variable_name} 1"
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
+        variable_structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
             odessa_base, odessa_path
-        ):
-            variable_structure = odessa_base.get(odessa_path)
-            logger.debug(f"Collect variable structure {variable_structure}.")
-            array = np.array([variable_structure])
+        )
+        if variable_structure is not None:
+            logger.debug("Collect variable structure %s.", variable_structure)
+            array = np.array([variable_structure], dtype=np.float32)
 
         else:
             logger.debug(
-                f"Variable {variable_name} not in odessa base, fill array with np.nan."
+                "Variable %s not in odessa base, fill array with np.nan.", variable_name
             )
-            array = np.array([np.nan])
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
@@ -2543,22 +1999,22 @@ class AssasOdessaNetCDF4Converter:
             np.ndarray: An array containing the parsed variable data.
 
         """
-        logger.debug(f"Parse ASTEC variable {variable_name}, type cesar_io.")
+        logger.debug("Parse ASTEC variable %s, type cesar_io.", variable_name)
 
         odessa_path = f"CESAR_IO 1: OUTPUTS 1: {variable_name} 1"
 
-        if AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
+        variable_structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
             odessa_base, odessa_path
-        ):
-            variable_structure = odessa_base.get(odessa_path)
-            logger.debug(f"Collect variable structure {variable_structure}.")
-            array = np.array([variable_structure])
+        )
+        if variable_structure is not None:
+            logger.debug("Collect variable structure %s.", variable_structure)
+            array = np.array([variable_structure], dtype=np.float32)
 
         else:
             logger.debug(
-                f"Variable {variable_name} not in odessa base, fill array with np.nan."
+                "Variable %s not in odessa base, fill array with np.nan.", variable_name
             )
-            array = np.array([np.nan])
+            array = np.full((1), fill_value=np.nan, dtype=np.float32)
 
         return array
 
@@ -2576,18 +2032,45 @@ class AssasOdessaNetCDF4Converter:
         Returns:
             str: Value of the specified attribute.
 
+        """
+        logger.info(f"Read general meta data attribute {attribute_name}.")
+
+        meta_data = AssasOdessaNetCDF4Converter.get_all_general_meta_data(
+            netcdf4_file_path
+        )
+        if attribute_name not in meta_data:
+            raise AttributeError(
+                f"Attribute {attribute_name} not found in {netcdf4_file_path}."
+            )
+
+        return meta_data[attribute_name]
+
+    @staticmethod
+    def get_all_general_meta_data(
+        netcdf4_file_path: str,
+    ) -> dict:
+        """Read all general meta data from a netCDF4 file in one pass.
+
+        Args:
+            netcdf4_file_path (str): Path to the netCDF4 file.
+
+        Returns:
+            dict: Mapping of the global attribute names to their values.
+
         """
         netcdf4_path_object = Path(netcdf4_file_path)
         logger.info(
-            f"Read general meta data attribute {attribute_name}"
-            f"from hdf5 file with path {str(netcdf4_path_object)}."
+            f"Read general meta data from hdf5 file with path "
+            f"{str(netcdf4_path_object)}."
         )
 
-        value = None
         with netCDF4.Dataset(f"{netcdf4_path_object}", "r", format="NETCDF4") as ncfile:
-            value = ncfile.getncattr(attribute_name)
+            meta_data = {
+                attribute_name: ncfile.getncattr(attribute_name)
+                for attribute_name in ncfile.ncattrs()
+            }
 
-        return value
+        return meta_data
 
     @staticmethod
     def set_general_meta_data(
@@ -2628,40 +2111,97 @@ class AssasOdessaNetCDF4Converter:
                 ncfile = ncfile.groups[group_name]
             else:
                 logger.info("Reading metadata from root group.")
-            for variable_name in ncfile.variables.keys():
-                variable_dict = {}
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            for variable_name, variable in ncfile.variables.items():
+                logger.info("Read variable %s.", variable_name)
+
+                variable_dict = {
+                    "name": variable_name,
+                    "dimensions": "(" + ", ".join(variable.dimensions) + ")",
+                    "shape": "(" + ", ".join(map(str, variable.shape)) + ")",
+                    "domain": (
+                        "-"
+                        if variable_name == "time_points"
+                        else variable.getncattr("domain")
+                    ),
+                }
+
+                if debug_enabled:
+                    logger.debug(
+                        "Dimension string is %s, shape string is %s, domain string is"
+                        " %s.",
+                        variable_dict["dimensions"],
+                        variable_dict["shape"],
+                        variable_dict["domain"],
+                    )
+                    for attr_name in variable.ncattrs():
+                        logger.debug("Attribute name %s.", attr_name)
 
-                variable_dict["name"] = variable_name
-                logger.info(f"Read variable {variable_name}.")
+                result.append(variable_dict)
 
-                dimensions = ncfile.variables[variable_name].dimensions
+        return result
 
-                variable_dict["dimensions"] = (
-                    "(" + ", ".join(str(dimension) for dimension in dimensions) + ")"
-                )
-                logger.debug(f"Dimension string is {variable_dict['dimensions']}.")
+    @staticmethod
+    def read_meta_values_from_netcdf4_files(
+        netcdf4_files: List[str],
+        group_name: str = None,
+        number_of_workers: int = 1,
+    ) -> List[Optional[List[dict]]]:
+        """Read meta values from several netCDF4 files.
 
-                shapes = ncfile.variables[variable_name].shape
+        With more than one worker, each file is read in a separate worker process,
+        so every worker owns its own HDF5 library state instead of serializing on
+        the global lock. A file which cannot be read is logged and skipped, it
+        does not stop the other files.
 
-                variable_dict["shape"] = (
-                    "(" + ", ".join(str(shape) for shape in shapes) + ")"
-                )
-                logger.debug(f"Shape string is {variable_dict['shape']}.")
+        Args:
+            netcdf4_files (List[str]): Paths to the netCDF4 files.
+            group_name (str, optional): Name of the group to read from.
+                Defaults to None, which reads from the root group.
+            number_of_workers (int): Number of worker processes. Defaults to 1,
+                which reads the files in the current process.
 
-                if variable_name == "time_points":
-                    domain = "-"
-                else:
-                    domain = ncfile.variables[variable_name].getncattr("domain")
+        Returns:
+            List[Optional[List[dict]]]: The variable metadata of each file, in the
+                order of the given paths, None for files which could not be read.
+
+        """
+        read_meta_values = partial(
+            AssasOdessaNetCDF4Converter.read_variables_meta_values_from_netcdf4,
+            group_name=group_name,
+        )
+        meta_values = []
 
-                variable_dict["domain"] = domain
-                logger.debug(f"Domain string is {variable_dict['domain']}.")
+        if number_of_workers <= 1 or len(netcdf4_files) < 2:
+            for netcdf4_file in netcdf4_files:
+                try:
+                    meta_values.append(read_meta_values(netcdf4_file))
+                except Exception as exception:
+                    logger.error(
+                        f"Read meta values from {netcdf4_file} failed due to "
+                        f"exception: {exception}."
+                    )
+                    meta_values.append(None)
 
-                for attr_name in ncfile.variables[variable_name].ncattrs():
-                    logger.debug(f"Attribute name {attr_name}.")
+            return meta_values
 
-                result.append(variable_dict)
+        logger.info(f"Read meta values from {len(netcdf4_files)} netCDF4 files.")
+        with ProcessPoolExecutor(max_workers=number_of_workers) as executor:
+            futures = [
+                executor.submit(read_meta_values, netcdf4_file)
+                for netcdf4_file in netcdf4_files
+            ]
+            for netcdf4_file, future in zip(netcdf4_files, futures):
+                try:
+                    meta_values.append(future.result())
+                except Exception as exception:
+                    logger.error(
+                        f"Read meta values from {netcdf4_file} failed due to "
+                        f"exception: {exception}."
+                    )
+                    meta_values.append(None)
 
-        return result
+        return meta_values
 
     @staticmethod
     def get_completed_index_from_netcdf4_file(
@@ -2673,14 +2213,15 @@ class AssasOdessaNetCDF4Converter:
             netcdf4_file (str): Path to the netCDF4 file.
 
         Returns:
-            int: The completed index of time points.
+            int: The completed index of time points, -1 if no time point is
+            converted yet.
 
         """
         logger.info(
             f"Get completed index from hdf5 file with path {str(netcdf4_file)}."
         )
 
-        completed_index = 0
+        completed_index = -1
         with netCDF4.Dataset(f"{netcdf4_file}", "r", format="NETCDF4") as ncfile:
             if "time_points" in list(ncfile.variables.keys()):
                 completed_index = ncfile.variables["time_points"].getncattr(
@@ -2698,6 +2239,9 @@ class AssasOdessaNetCDF4Converter:
     ) -> None:
         """Reset the completed index in a netCDF4 file.
 
+        The completed index is set to -1, so that the conversion restarts at the
+        first time point.
+
         Args:
             netcdf4_file (str): Path to the netCDF4 file.
 
@@ -2711,8 +2255,8 @@ class AssasOdessaNetCDF4Converter:
 
         with netCDF4.Dataset(f"{netcdf4_file}", "a", format="NETCDF4") as ncfile:
             if "time_points" in list(ncfile.variables.keys()):
-                ncfile.variables["time_points"].setncattr("completed_index", 0)
-                logger.info("Completed index reset to 0.")
+                ncfile.variables["time_points"].setncattr("completed_index", -1)
+                logger.info("Completed index reset to -1.")
             else:
                 logger.warning("No time points found in the netCDF4 file.")
 
@@ -2746,7 +2290,7 @@ class AssasOdessaNetCDF4Converter:
             return meta_data
 
         logger.debug(
-            f"Number of {domain} {element} in odessa base: {number_of_elements}."
+            "Number of %s %s in odessa base: %s.", domain, element, number_of_elements
         )
 
         for number in range(1, number_of_elements + 1):
@@ -2768,7 +2312,7 @@ class AssasOdessaNetCDF4Converter:
                     )
                     continue
                 logger.debug(
-                    f"Collect {domain} {element} {attr} structure {structure}."
+                    "Collect %s %s %s structure %s.", domain, element, attr, structure
                 )
                 metadata[attr.lower()] = structure
 
@@ -2889,15 +2433,506 @@ class AssasOdessaNetCDF4Converter:
                     "Added metadata dictionary to 'primary_volume_meta' variable."
                 )
 
+    def get_conversion_plan(
+        self,
+        variable_datasets: dict,
+    ) -> List[tuple]:
+        """Resolve the conversion of the ASTEC variables once for all time points.
+
+        The dataset, the strategy function and the odessa name of each variable
+        are looked up here, so that the loop over the time points does not need
+        to access the variable index or the strategy mapping again.
+
+        Args:
+            variable_datasets (dict): Mapping of variable names to the netCDF4
+                variables which receive the converted data.
+
+        Returns:
+            List[tuple]: One tuple (name, dataset, strategy function, odessa name,
+            odessa index) per variable to convert. The odessa index is None for
+            strategies without index.
+
+        """
+        conversion_plan = []
+        # Plain dicts per row, iterrows would build a Series for every variable
+        for variable in self.variable_index.to_dict("records"):
+            if variable["name"] not in variable_datasets:
+                logger.info(f"Variable {variable['name']} not required to convert.")
+                continue
+
+            index = None if np.isnan(variable["index"]) else int(variable["index"])
+            conversion_plan.append(
+                (
+                    variable["name"],
+                    variable_datasets[variable["name"]],
+                    self.variable_strategy_mapping[variable["strategy"]],
+                    variable["name_odessa"],
+                    index,
+                )
+            )
+
+        logger.info(f"Prepared conversion of {len(conversion_plan)} variables.")
+
+        return conversion_plan
+
+    def parse_odessa_base(
+        self,
+        odessa_base: pyod.Base,
+        conversion_plan: List[tuple],
+    ) -> List[np.ndarray]:
+        """Parse the planned ASTEC variables from one odessa base.
+
+        The structures cached while parsing are released afterwards, so that no
+        odessa base is kept alive after its time point.
+
+        Args:
+            odessa_base: The odessa base object.
+            conversion_plan (List[tuple]): Conversion plan of the variables.
+
+        Returns:
+            List[np.ndarray]: The parsed data in the order of the conversion plan.
+
+        """
+        data_list = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        try:
+            for name, _, strategy_function, name_odessa, index in conversion_plan:
+                logger.info("Parse ASTEC variable %s.", name)
+
+                # All strategy functions take (odessa_base, variable_name[, index]),
+                # positional arguments avoid the keyword matching of every call
+                if index is None:
+                    data = strategy_function(odessa_base, name_odessa)
+                else:
+                    data = strategy_function(odessa_base, name_odessa, index)
+
+                if debug_enabled:
+                    logger.debug(
+                        "Read data for %s with shape %s. Odessa index %s.",
+                        name_odessa,
+                        data.shape,
+                        index,
+                    )
+
+                data_list.append(data)
+        finally:
+            AssasOdessaNetCDF4Converter.clear_odessa_base_cache()
+
+        return data_list
+
+    def get_variable_shapes(self) -> dict:
+        """Get the shapes of the ASTEC variables from the first and last time point.
+
+        The spatial dimensions of the netCDF4 file are unlimited, so their
+        extents are only known from parsed data. Structures can appear during a
+        run, so the larger extent of the first and the last time point is used.
+        The shapes size the chunks of the variables when these are created.
+
+        Returns:
+            dict: Mapping of variable names to the shape of one time point.
+
+        """
+        conversion_plan = self.get_conversion_plan(
+            dict.fromkeys(self.variable_index["name"])
+        )
+        variable_shapes = {}
+        for index in dict.fromkeys((0, len(self.time_points) - 1)):
+            data_list = self.parse_odessa_base(
+                self.get_odessa_base_from_index(index), conversion_plan
+            )
+            for (name, *_), data in zip(conversion_plan, data_list):
+                shape = variable_shapes.setdefault(name, data.shape)
+                if len(shape) == data.ndim:
+                    variable_shapes[name] = tuple(
+                        int(extent) for extent in np.maximum(shape, data.shape)
+                    )
+
+        return variable_shapes
+
+    def parse_time_points(
+        self,
+        time_points: List[float],
+        conversion_plan: List[tuple],
+        number_of_workers: int = 1,
+    ) -> Iterator[List[np.ndarray]]:
+        """Parse the planned ASTEC variables for consecutive time points.
+
+        With more than one worker, the time points are restored and parsed in
+        worker processes. The results are returned in the order of the time
+        points in both cases.
+
+        Args:
+            time_points (List[float]): The time points to parse.
+            conversion_plan (List[tuple]): Conversion plan of the variables.
+            number_of_workers (int): Number of worker processes. Defaults to 1,
+                which parses the time points in the current process.
+
+        Returns:
+            Iterator[List[np.ndarray]]: The parsed data of each time point in the
+            order of the conversion plan.
+
+        """
+        if number_of_workers <= 1:
+            for time_point in time_points:
+                logger.info("Restore odessa base for time point %s.", time_point)
+                odessa_base = pyod.restore(str(self.input_path), time_point)
+                yield self.parse_odessa_base(odessa_base, conversion_plan)
+            return
+
+        logger.info(f"Parse time points with {number_of_workers} worker processes.")
+        variable_names = [name for name, *_ in conversion_plan]
+        time_point_iterator = iter(time_points)
+
+        with ProcessPoolExecutor(
+            max_workers=number_of_workers,
+            initializer=_initialize_conversion_worker,
+            initargs=(self, variable_names),
+        ) as executor:
+            # Keep a bounded number of time points in flight
+            pending = deque(
+                executor.submit(_parse_time_point_in_worker, time_point)
+                for _, time_point in zip(
+                    range(2 * number_of_workers), time_point_iterator
+                )
+            )
+            while pending:
+                data_list = pending.popleft().result()
+                for time_point in time_point_iterator:
+                    pending.append(
+                        executor.submit(_parse_time_point_in_worker, time_point)
+                    )
+                    break
+                yield data_list
+
+    @staticmethod
+    def get_variable_storage_options(
+        number_of_time_points: int,
+        dimensions: Tuple[str, ...],
+        spatial_shape: Optional[Tuple[int, ...]] = None,
+    ) -> dict:
+        """Get the compression and chunking options of a time dependent variable.
+
+        Chunks hold about CHUNK_BYTES of float32 values. The spatial dimensions
+        are chunked by their extent, limited so that one write buffer of time
+        points still fits into a chunk. The time dimension takes the remaining
+        size, in multiples of the write buffer.
+
+        Args:
+            number_of_time_points (int): Length of the time dimension.
+            dimensions (Tuple[str, ...]): Dimensions of the variable.
+            spatial_shape (Optional[Tuple[int, ...]]): Extents of the dimensions
+                after time. Defaults to None, which chunks unknown extents by the
+                limit only.
+
+        Returns:
+            dict: Keyword arguments for createVariable, empty if the variable
+            does not start with the time dimension.
+
+        """
+        if len(dimensions) == 0 or dimensions[0] != "time":
+            return {}
+
+        chunk_elements = CHUNK_BYTES // np.dtype(np.float32).itemsize
+        number_of_spatial_dimensions = len(dimensions) - 1
+        if spatial_shape is None or len(spatial_shape) != number_of_spatial_dimensions:
+            spatial_shape = (0,) * number_of_spatial_dimensions
+
+        spatial_chunk_limit = 1
+        if number_of_spatial_dimensions > 0:
+            spatial_chunk_limit = max(
+                1,
+                int(
+                    (chunk_elements // WRITE_BUFFER_SIZE)
+                    ** (1 / number_of_spatial_dimensions)
+                ),
+            )
+        spatial_chunk_sizes = tuple(
+            min(extent, spatial_chunk_limit) if extent > 0 else spatial_chunk_limit
+            for extent in spatial_shape
+        )
+
+        time_chunk_size = chunk_elements // int(np.prod(spatial_chunk_sizes))
+        if time_chunk_size > WRITE_BUFFER_SIZE:
+            # Buffered writes never split a time chunk in two
+            time_chunk_size -= time_chunk_size % WRITE_BUFFER_SIZE
+        time_chunk_size = max(1, min(number_of_time_points, time_chunk_size))
+
+        return {
+            "zlib": True,
+            "complevel": COMPRESSION_LEVEL,
+            "shuffle": True,
+            "chunksizes": (time_chunk_size,) + spatial_chunk_sizes,
+        }
+
+    @staticmethod
+    def set_variable_chunk_cache(dataset: netCDF4.Variable) -> None:
+        """Size the chunk cache of a variable for the buffered writes.
+
+        Time chunks of small variables span several write buffers, the cache
+        keeps these chunks in memory between the writes instead of compressing
+        and reading them back for each buffer.
+
+        Args:
+            dataset (netCDF4.Variable): The netCDF4 variable to write into.
+
+        Returns:
+            None
+
+        """
+        chunking = dataset.chunking()
+        if chunking == "contiguous":
+            return
+
+        chunk_bytes = int(np.prod(chunking)) * dataset.dtype.itemsize
+        dataset.set_var_chunk_cache(size=max(CHUNK_CACHE_SIZE, 4 * chunk_bytes))
+
+    @staticmethod
+    def write_time_point_data(
+        dataset: netCDF4.Variable,
+        start_index: int,
+        data_list: List[np.ndarray],
+    ) -> None:
+        """Write the data of consecutive time points into a netCDF4 variable.
+
+        The data is written in one hyperslab if all time points have the same
+        shape, otherwise each time point is written separately.
+
+        Args:
+            dataset (netCDF4.Variable): The netCDF4 variable to write into.
+            start_index (int): Index of the first time point in the variable.
+            data_list (List[np.ndarray]): Data of the consecutive time points.
+
+        Returns:
+            None
+
+        """
+        if len(data_list) == 0:
+            return
+
+        shape = data_list[0].shape
+        if not all(data.shape == shape for data in data_list):
+            block = None
+        elif len(shape) == dataset.ndim - 1:
+            block = np.stack(data_list)
+        elif dataset.ndim == 1 and shape == (1,):
+            block = np.concatenate(data_list)
+        else:
+            block = None
+
+        if block is not None:
+            dataset[start_index : start_index + len(data_list)] = block
+        else:
+            logger.debug(
+                "Shapes of variable %s do not match the time points "
+                "hyperslab, write time points separately.",
+                dataset.name,
+            )
+            for offset, data in enumerate(data_list):
+                dataset[start_index + offset] = data
+
+    @staticmethod
+    def fill_beyond_written_shape(
+        dataset: netCDF4.Variable,
+        start_index: int,
+        stop_index: int,
+        written_shape: Tuple[int, ...],
+    ) -> None:
+        """Fill the part of a variable beyond the written shape with np.nan.
+
+        A shared unlimited dimension can grow beyond the largest shape written
+        into a variable. The stored extent of the variable is then smaller than
+        the dimension and netCDF4 reads the remaining part incorrectly, so it is
+        written with np.nan for the converted time points.
+
+        Args:
+            dataset (netCDF4.Variable): The netCDF4 variable to fill.
+            start_index (int): Index of the first converted time point.
+            stop_index (int): Index after the last converted time point.
+            written_shape (Tuple[int, ...]): Largest spatial shape written into
+                the variable for the converted time points.
+
+        Returns:
+            None
+
+        """
+        if len(written_shape) != dataset.ndim - 1:
+            return
+
+        for axis, (written, extent) in enumerate(
+            zip(written_shape, dataset.shape[1:]), start=1
+        ):
+            if written >= extent:
+                continue
+
+            region = [slice(None)] * dataset.ndim
+            region[0] = slice(start_index, stop_index)
+            region[axis] = slice(written, extent)
+            shape = list(dataset.shape)
+            shape[0] = stop_index - start_index
+            shape[axis] = extent - written
+            logger.debug(
+                "Fill variable %s beyond written extent %s on axis %s.",
+                dataset.name,
+                written,
+                axis,
+            )
+            dataset[tuple(region)] = np.full(shape, np.nan, dtype=dataset.dtype)
+
+    @staticmethod
+    def write_buffered_data(
+        conversion_plan: List[tuple],
+        start_index: int,
+        buffered_data: List[List[np.ndarray]],
+        time_points_variable: Optional[netCDF4.Variable],
+        completed_index: int,
+    ) -> None:
+        """Write the buffered time points of all planned variables.
+
+        The completed index is updated after all variables are written, so an
+        interrupted conversion resumes at the first unwritten time point.
+
+        Args:
+            conversion_plan (List[tuple]): Conversion plan of the variables.
+            start_index (int): Index of the first buffered time point.
+            buffered_data (List[List[np.ndarray]]): Buffered data per variable in
+                the order of the conversion plan.
+            time_points_variable (Optional[netCDF4.Variable]): The time points
+                variable holding the completed index, None to leave it unchanged.
+            completed_index (int): Index of the last buffered time point.
+
+        Returns:
+            None
+
+        """
+        for (_, dataset, *_), data_list in zip(conversion_plan, buffered_data):
+            AssasOdessaNetCDF4Converter.write_time_point_data(
+                dataset, start_index, data_list
+            )
+
+        if time_points_variable is not None:
+            time_points_variable.completed_index = completed_index
+
+    def convert_time_points(
+        self,
+        conversion_plan: List[tuple],
+        time_points: List[float],
+        start_index: int,
+        time_points_variable: Optional[netCDF4.Variable],
+        number_of_workers: int = 1,
+    ) -> None:
+        """Parse and write the planned ASTEC variables for consecutive time points.
+
+        The parsed time points are buffered and written at the boundaries of the
+        time chunks, in a background thread while the next time points are
+        parsed. At most one write is in flight at a time.
+
+        Args:
+            conversion_plan (List[tuple]): Conversion plan of the variables.
+            time_points (List[float]): The time points to convert.
+            start_index (int): Index of the first time point in the file.
+            time_points_variable (Optional[netCDF4.Variable]): The time points
+                variable holding the completed index, None to leave it unchanged.
+            number_of_workers (int): Number of worker processes parsing the time
+                points in parallel. Defaults to 1, which converts serially.
+
+        Returns:
+            None
+
+        """
+        for _, dataset, *_ in conversion_plan:
+            # The Dataset setter only covers variables existing at the call
+            dataset.set_auto_maskandscale(False)
+            self.set_variable_chunk_cache(dataset)
+
+        buffered_data = [[] for _ in conversion_plan]
+        buffer_start_index = start_index
+        written_shapes = [() for _ in conversion_plan]
+
+        progress_bar = tqdm(
+            self.parse_time_points(time_points, conversion_plan, number_of_workers),
+            total=len(time_points),
+        )
+        last_index = start_index + len(time_points) - 1
+        pending_write: Optional[Future] = None
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            for time_index, data_list in enumerate(progress_bar, start_index):
+                for idx, data_per_timestep in enumerate(data_list):
+                    buffered_data[idx].append(data_per_timestep)
+                    written_shapes[idx] = tuple(
+                        max(sizes)
+                        for sizes in zip_longest(
+                            written_shapes[idx], data_per_timestep.shape, fillvalue=0
+                        )
+                    )
+
+                # progress_bar.n is only updated when the bar is refreshed
+                if (time_index - start_index) % LOG_INTERVAL == 0:
+                    logger.info(str(progress_bar))
+
+                # Flush at the boundaries of the time chunks, also when a
+                # resumed conversion starts in the middle of a chunk
+                if (time_index + 1) % WRITE_BUFFER_SIZE == 0 or (
+                    time_index == last_index
+                ):
+                    if pending_write is not None:
+                        pending_write.result()
+                    pending_write = writer.submit(
+                        self.write_buffered_data,
+                        conversion_plan,
+                        buffer_start_index,
+                        buffered_data,
+                        time_points_variable,
+                        time_index,
+                    )
+
+                    buffered_data = [[] for _ in conversion_plan]
+                    buffer_start_index = time_index + 1
+
+            if pending_write is not None:
+                pending_write.result()
+
+        for (_, dataset, *_), written_shape in zip(conversion_plan, written_shapes):
+            self.fill_beyond_written_shape(
+                dataset, start_index, last_index + 1, written_shape
+            )
+
+    @staticmethod
+    def get_used_dimensions(variable_index: pd.DataFrame) -> List[str]:
+        """Get the dimensions referenced by the variables of the index.
+
+        Unused unlimited dimensions would still add dimension scales to the
+        file, so only the referenced ones are created.
+
+        Args:
+            variable_index (pd.DataFrame): Variable index with a dimension column
+                of semicolon separated dimension names.
+
+        Returns:
+            List[str]: Referenced dimension names in order of first occurrence,
+                without the placeholder "none".
+
+        """
+        used_dimensions = dict.fromkeys(
+            dimension
+            for dimensions in variable_index["dimension"]
+            for dimension in dimensions.split(";")
+        )
+        used_dimensions.pop("none", None)
+
+        return list(used_dimensions)
+
     def convert_astec_variables_to_netcdf4(
         self,
         maximum_index: int = None,
+        number_of_workers: int = 1,
     ) -> None:
         """Convert the data for given ASTEC variables from odessa into hdf5.
 
         Args:
             maximum_index (int): Maximum index to convert. If None, all time points
             are converted.
+            number_of_workers (int): Number of worker processes parsing the time
+            points in parallel. Defaults to 1, which converts serially.
 
         Returns:
             None
@@ -2908,24 +2943,21 @@ class AssasOdessaNetCDF4Converter:
         with netCDF4.Dataset(f"{self.output_path}", "a", format="NETCDF4") as ncfile:
             if "time_points" not in list(ncfile.variables.keys()):
                 variable_datasets = {}
+                variable_shapes = self.get_variable_shapes()
 
                 ncfile.createDimension("time", len(self.time_points))
-                ncfile.createDimension("mesh", None)
-                ncfile.createDimension("pipe", None)
-                ncfile.createDimension("junction", None)
-                ncfile.createDimension("volume", None)
-                ncfile.createDimension("face", None)
-                ncfile.createDimension("wall", None)
-                ncfile.createDimension("connecti", None)
-                ncfile.createDimension("component", None)
-                ncfile.createDimension("cesar_output", None)
-                ncfile.createDimension("wall_profile", None)
+                for dimension in self.get_used_dimensions(self.variable_index):
+                    ncfile.createDimension(dimension, None)
 
                 time_dataset = ncfile.createVariable(
-                    varname="time_points", datatype=np.float32, dimensions="time"
+                    varname="time_points",
+                    datatype=np.float32,
+                    dimensions="time",
+                    contiguous=True,
                 )
                 time_dataset[:] = self.time_points
-                time_dataset.completed_index = 0
+                # No time point is written yet, resume starts at completed + 1
+                time_dataset.completed_index = -1
 
                 for idx, variable in self.variable_index.iterrows():
                     if variable["name"] in list(ncfile.variables.keys()):
@@ -2951,18 +2983,30 @@ class AssasOdessaNetCDF4Converter:
                         varname=variable["name"],
                         datatype=np.float32,
                         dimensions=tuple(dimensions),
+                        **self.get_variable_storage_options(
+                            len(self.time_points),
+                            tuple(dimensions),
+                            variable_shapes.get(variable["name"]),
+                        ),
                     )
 
-                    variable_datasets[variable["name"]].long_name = variable[
-                        "long_name"
-                    ]
-                    variable_datasets[variable["name"]].unit = variable["unit"]
-                    variable_datasets[variable["name"]].domain = variable["domain"]
-                    variable_datasets[variable["name"]].strategy = variable["strategy"]
+                    variable_datasets[variable["name"]].setncatts(
+                        {
+                            "long_name": variable["long_name"],
+                            "unit": variable["unit"],
+                            "domain": variable["domain"],
+                            "strategy": variable["strategy"],
+                        }
+                    )
 
                 start_index = 0
 
             else:
+                variable_datasets = {
+                    name: ncfile.variables[name]
+                    for name in self.variable_index["name"]
+                    if name in ncfile.variables
+                }
                 start_index = (
                     ncfile.variables["time_points"].getncattr("completed_index") + 1
                 )
@@ -2989,62 +3033,26 @@ class AssasOdessaNetCDF4Converter:
                     f"{len(self.time_points)}. {len(time_points)} time points left."
                 )
 
-            progress_bar = tqdm(time_points)
-            for idx, time_point in enumerate(progress_bar):
-                logger.info(f"Restore odessa base for time point {time_point}.")
-                odessa_base = pyod.restore(str(self.input_path), time_point)
-
-                for _, variable in self.variable_index.iterrows():
-                    if variable["name"] not in list(variable_datasets.keys()):
-                        logger.info(
-                            f"Variable {variable['name']} not required to convert."
-                        )
-                        continue
-                    logger.info(
-                        f"Parse ASTEC variable {variable['name']} for time point "
-                        f"{time_point}."
-                    )
-                    strategy_function = self.variable_strategy_mapping[
-                        variable["strategy"]
-                    ]
-
-                    if np.isnan(variable["index"]):
-                        data_per_timestep = strategy_function(
-                            odessa_base=odessa_base,
-                            variable_name=variable["name_odessa"],
-                        )
-                    else:
-                        data_per_timestep = strategy_function(
-                            odessa_base=odessa_base,
-                            variable_name=variable["name_odessa"],
-                            index=int(variable["index"]),
-                        )
-
-                    logger.debug(
-                        f"Read data for {variable['name_odessa']} with "
-                        f"shape {data_per_timestep.shape}. "
-                        f"Odessa index {variable['index']}, "
-                        f"isnan {np.isnan(variable['index'])}."
-                    )
-
-                    ncfile.variables[variable["name"]][start_index + idx] = (
-                        data_per_timestep
-                    )
-
-                if progress_bar.n % LOG_INTERVAL == 0:
-                    logger.info(str(progress_bar))
-
-                ncfile.variables["time_points"].completed_index = start_index + idx
+            self.convert_time_points(
+                self.get_conversion_plan(variable_datasets),
+                time_points,
+                start_index,
+                ncfile.variables["time_points"],
+                number_of_workers,
+            )
 
     def populate_data_from_groups_to_netcdf4(
         self,
         maximum_index: int = None,
+        number_of_workers: int = 1,
     ) -> None:
         """Convert the data for given ASTEC variables from odessa into netCDF4.
 
         Args:
             maximum_index (int): Maximum index to convert. If None, all time points
             are converted.
+            number_of_workers (int): Number of worker processes parsing the time
+            points in parallel. Defaults to 1, which converts serially.
 
         Returns:
             None
@@ -3096,63 +3104,20 @@ class AssasOdessaNetCDF4Converter:
             variable_datasets = self.get_all_variable_datasets(ncfile)
             logger.info(f"Found {len(variable_datasets)} variables to populate.")
 
-            progress_bar = tqdm(time_points)
-            for idx, time_point in enumerate(progress_bar):
-                logger.info(f"Restore odessa base for time point {time_point}.")
-                odessa_base = pyod.restore(str(self.input_path), time_point)
-
-                for _, variable in self.variable_index.iterrows():
-                    var_name = variable["name"]
-
-                    # Check if variable exists in any location (root or groups)
-                    if var_name not in variable_datasets:
-                        logger.info(
-                            f"Variable {var_name} not found in any location, skipping."
-                        )
-                        continue
-
-                    # Get the variable dataset and its location info
-                    var_info = variable_datasets[var_name]
-                    var_dataset = var_info["dataset"]
-                    location_path = var_info["location"]
-
-                    logger.info(
-                        f"Parse ASTEC variable {var_name} for time point "
-                        f"{time_point} in {location_path}."
-                    )
-
-                    strategy_function = self.variable_strategy_mapping[
-                        variable["strategy"]
-                    ]
-
-                    if np.isnan(variable["index"]):
-                        data_per_timestep = strategy_function(
-                            odessa_base=odessa_base,
-                            variable_name=variable["name_odessa"],
-                        )
-                    else:
-                        data_per_timestep = strategy_function(
-                            odessa_base=odessa_base,
-                            variable_name=variable["name_odessa"],
-                            index=int(variable["index"]),
-                        )
-
-                    logger.debug(
-                        f"Read data for {variable['name_odessa']} with "
-                        f"shape {data_per_timestep.shape}. "
-                        f"Odessa index {variable['index']}, "
-                        f"isnan {np.isnan(variable['index'])}."
-                    )
-
-                    # Populate data in the variable dataset
-                    var_dataset[start_index + idx] = data_per_timestep
-
-                if progress_bar.n % LOG_INTERVAL == 0:
-                    logger.info(str(progress_bar))
-
-                dimension_group.variables["time_points"].completed_index = (
-                    start_index + idx
-                )
+            # Resolve datasets and strategies once for all time points
+            conversion_plan = self.get_conversion_plan(
+                {
+                    var_name: var_info["dataset"]
+                    for var_name, var_info in variable_datasets.items()
+                }
+            )
+            self.convert_time_points(
+                conversion_plan,
+                time_points,
+                start_index,
+                dimension_group.variables["time_points"],
+                number_of_workers,
+            )
 
     def get_all_variable_datasets(self, ncfile: netCDF4.Dataset) -> dict:
         """Get all variable datasets from root and groups.
@@ -3171,7 +3136,7 @@ class AssasOdessaNetCDF4Converter:
                     "group": group_name,
                     "subgroup": None,
                 }
-                logger.debug(f"Found variable {var_name} in group {group_name}.")
+                logger.debug("Found variable %s in group %s.", var_name, group_name)
 
             # Variables in subgroups
             for subgroup_name, subgroup in group.groups.items():
@@ -3183,8 +3148,10 @@ class AssasOdessaNetCDF4Converter:
                         "subgroup": subgroup_name,
                     }
                     logger.debug(
-                        f"Found variable {var_name} in "
-                        f"subgroup {group_name}/{subgroup_name}."
+                        "Found variable %s in subgroup %s/%s.",
+                        var_name,
+                        group_name,
+                        subgroup_name,
                     )
 
         # Then, get variables from root level (only if not already found in groups)
@@ -3200,12 +3167,12 @@ class AssasOdessaNetCDF4Converter:
                     "group": None,
                     "subgroup": None,
                 }
-                logger.debug(f"Found variable {var_name} at root level.")
+                logger.debug("Found variable %s at root level.", var_name)
             else:
                 # Variable exists in group, mark root version as deprecated
                 if hasattr(ncfile.variables[var_name], "moved_to_group"):
                     logger.debug(
-                        f"Variable {var_name} at root marked as moved to group"
+                        "Variable %s at root marked as moved to group", var_name
                     )
                 else:
                     logger.warning(
@@ -3318,12 +3285,15 @@ class AssasOdessaNetCDF4Converter:
         self,
         group_name: str,
         maximum_index: int = None,
+        number_of_workers: int = 1,
     ) -> None:
         """Populate data for variables in a specific group only.
 
         Args:
             group_name (str): Name of the group to populate
             maximum_index (int): Maximum index to convert
+            number_of_workers (int): Number of worker processes parsing the time
+            points in parallel. Defaults to 1, which converts serially.
 
         Returns:
             None
@@ -3366,48 +3336,17 @@ class AssasOdessaNetCDF4Converter:
                     f"{len(self.time_points)}. {len(time_points)} time points left."
                 )
 
-            progress_bar = tqdm(time_points)
-            for idx, time_point in enumerate(progress_bar):
-                logger.info(f"Restore odessa base for time point {time_point}.")
-                odessa_base = pyod.restore(str(self.input_path), time_point)
-
-                for var_name, var_info in variable_datasets.items():
-                    var_dataset = var_info["dataset"]
-                    location_path = var_info["location"]
-
-                    logger.info(
-                        f"Parse ASTEC variable {var_name} for time point "
-                        f"{time_point} in {location_path}."
-                    )
-
-                    strategy_function = self.variable_strategy_mapping[
-                        var_info["dataset"].strategy
-                    ]
-
-                    if np.isnan(var_info["dataset"].index):
-                        data_per_timestep = strategy_function(
-                            odessa_base=odessa_base,
-                            variable_name=var_info["dataset"].name_odessa,
-                        )
-                    else:
-                        data_per_timestep = strategy_function(
-                            odessa_base=odessa_base,
-                            variable_name=var_info["dataset"].name_odessa,
-                            index=int(var_info["dataset"].index),
-                        )
-
-                    logger.debug(
-                        f"Read data for {var_info['dataset'].name_odessa} with "
-                        f"shape {data_per_timestep.shape}. "
-                        f"Odessa index {var_info['dataset'].index}, "
-                        f"isnan {np.isnan(var_info['dataset'].index)}."
-                    )
-
-                    # Populate data in the variable dataset
-                    var_dataset[start_index + idx] = data_per_timestep
-
-                if progress_bar.n % LOG_INTERVAL == 0:
-                    logger.info(str(progress_bar))
+            # Resolve datasets and strategies once for all time points, the
+            # completed index covers all groups and is left unchanged
+            conversion_plan = self.get_conversion_plan(
+                {
+                    var_name: var_info["dataset"]
+                    for var_name, var_info in variable_datasets.items()
+                }
+            )
+            self.convert_time_points(
+                conversion_plan, time_points, start_index, None, number_of_workers
+            )
 
     def update_domain_attributes_for_all_variables(self) -> None:
         """Update domain attributes for all variables in the netCDF4 file.
@@ -3451,8 +3390,9 @@ class AssasOdessaNetCDF4Converter:
                             )
                         else:
                             logger.debug(
-                                f"Domain for {var_name} already correct: "
-                                f"{correct_domain}."
+                                "Domain for %s already correct: %s.",
+                                var_name,
+                                correct_domain,
                             )
                     else:
                         var.domain = correct_domain
@@ -3564,9 +3504,12 @@ class AssasOdessaNetCDF4Converter:
             new_var[:] = original_var[:]
 
             # Copy all attributes
-            for attr_name in original_var.ncattrs():
-                attr_value = original_var.getncattr(attr_name)
-                new_var.setncattr(attr_name, attr_value)
+            new_var.setncatts(
+                {
+                    attr_name: original_var.getncattr(attr_name)
+                    for attr_name in original_var.ncattrs()
+                }
+            )
 
             # Add group information to variable
             new_var.setncattr("group_path", group_path)
@@ -3594,6 +3537,8 @@ class AssasOdessaNetCDF4Converter:
         unit_str: str,
         long_name: str,
         data_type: np.float32 = np.float32,
+        contiguous: bool = False,
+        spatial_shape: Optional[Tuple[int, ...]] = None,
     ) -> netCDF4.Variable:
         """Create NetCDF4 variable with proper unit handling."""
         # Validate and normalize unit
@@ -3616,18 +3561,27 @@ class AssasOdessaNetCDF4Converter:
                     size = len(source_dim) if not source_dim.isunlimited() else None
                     target_group.createDimension(dim_name, size)
                     logger.debug(
-                        f"Copied dimension {dim_name} to group {target_group.name}"
+                        "Copied dimension %s to group %s", dim_name, target_group.name
                     )
                 else:
                     logger.error(f"Dimension {dim_name} not found in dimensions group")
                     raise ValueError(f"Required dimension {dim_name} not available")
 
         # Now create the variable
+        if contiguous:
+            # Small fixed size variables are stored without chunk index
+            storage_options = {"contiguous": True}
+        else:
+            storage_options = self.get_variable_storage_options(
+                len(self.time_points), tuple(var_dimensions), spatial_shape
+            )
         var = target_group.createVariable(
             var_name,
             data_type,
             var_dimensions,
+            **storage_options,
         )
+        var.set_auto_maskandscale(False)
 
         # Set attributes with normalized unit
         var.unit = normalized_unit
@@ -3648,7 +3602,7 @@ class AssasOdessaNetCDF4Converter:
         if standard_name:
             var.standard_name = standard_name
 
-        logger.debug(f"Created variable {var_name} with unit: {normalized_unit}")
+        logger.debug("Created variable %s with unit: %s", var_name, normalized_unit)
         return var
 
     def intialize_astec_variables_in_netcdf4(self) -> None:
@@ -3662,6 +3616,7 @@ class AssasOdessaNetCDF4Converter:
                 self.create_groups_in_ncfile(ncfile)
 
             variable_datasets = {}
+            variable_shapes = self.get_variable_shapes()
 
             # Initialize dimensions at root level
             dimension_list = self.variable_index["dimension"].unique().tolist()
@@ -3687,9 +3642,11 @@ class AssasOdessaNetCDF4Converter:
                 "seconds",
                 "Time points from ASTEC simulation",
                 np.float32,
+                contiguous=True,
             )
             time_dataset[:] = self.time_points
-            time_dataset.completed_index = 0
+            # No time point is written yet, resume starts at completed + 1
+            time_dataset.completed_index = -1
 
             # Create variables with proper unit handling
             for _, variable in self.variable_index.iterrows():
@@ -3732,11 +3689,16 @@ class AssasOdessaNetCDF4Converter:
                         tuple(dimensions),
                         variable["unit"],
                         variable["long_name"],
+                        spatial_shape=variable_shapes.get(var_name),
                     )
 
                     # Set additional ASTEC-specific attributes
-                    var_dataset.domain = variable["domain"]
-                    var_dataset.strategy = variable["strategy"]
+                    var_dataset.setncatts(
+                        {
+                            "domain": variable["domain"],
+                            "strategy": variable["strategy"],
+                        }
+                    )
 
                     # Add group information
                     if group_name:
@@ -3848,12 +3810,13 @@ class AssasOdessaNetCDF4Converter:
         if group_name:
             if subgroup_name:
                 logger.debug(
-                    f"Creating location path for group {group_name} "
-                    f"and subgroup {subgroup_name}."
+                    "Creating location path for group %s and subgroup %s.",
+                    group_name,
+                    subgroup_name,
                 )
                 return f"group/{group_name}/{subgroup_name}"
             else:
-                logger.debug(f"Creating location path for group {group_name}.")
+                logger.debug("Creating location path for group %s.", group_name)
                 return f"group/{group_name}"
         else:
             return "root"
@@ -3880,8 +3843,9 @@ class AssasOdessaNetCDF4Converter:
         for location, var_list in location_counts.items():
             logger.info(f"{location}: {len(var_list)} variables")
             logger.debug(
-                f"Variables: "
-                f"{', '.join(var_list[:5])}{'...' if len(var_list) > 5 else ''}"
+                "Variables: %s%s",
+                ", ".join(var_list[:5]),
+                "..." if len(var_list) > 5 else "",
             )
 
         logger.info(f"Total variables created: {len(variable_datasets)}")
@@ -4386,10 +4350,13 @@ class AssasOdessaNetCDF4Converter:
             new_var[:] = source_var[:]
 
             # Copy all attributes
-            for attr_name in source_var.ncattrs():
-                if attr_name not in ["_FillValue"]:  # Skip special attributes
-                    attr_value = source_var.getncattr(attr_name)
-                    new_var.setncattr(attr_name, attr_value)
+            new_var.setncatts(
+                {
+                    attr_name: source_var.getncattr(attr_name)
+                    for attr_name in source_var.ncattrs()
+                    if attr_name not in ["_FillValue"]  # Skip special attributes
+                }
+            )
 
             # Add movement tracking attributes
             new_var.setncattr("moved_from_root", 1)
@@ -4434,7 +4401,7 @@ class AssasOdessaNetCDF4Converter:
                     dim_size = None
 
                 target_location.createDimension(dim_name, dim_size)
-                logger.debug(f"Created dimension {dim_name} in target location")
+                logger.debug("Created dimension %s in target location", dim_name)
 
     def assign_data_variables_enhanced(self, ncfile: netCDF4.Dataset) -> None:
         """Assign data variables to appropriate data subgroups using enhanced config."""
@@ -4760,9 +4727,12 @@ class AssasOdessaNetCDF4Converter:
         target_group = target_location.createGroup(group_name)
 
         # Copy group attributes
-        for attr_name in source_group.ncattrs():
-            attr_value = source_group.getncattr(attr_name)
-            target_group.setncattr(attr_name, attr_value)
+        target_group.setncatts(
+            {
+                attr_name: source_group.getncattr(attr_name)
+                for attr_name in source_group.ncattrs()
+            }
+        )
 
         # Copy dimensions
         for dim_name, dim in source_group.dimensions.items():
@@ -4792,10 +4762,13 @@ class AssasOdessaNetCDF4Converter:
             target_var[:] = source_var[:]
 
             # Copy attributes
-            for attr_name in source_var.ncattrs():
-                if attr_name != "_FillValue":
-                    attr_value = source_var.getncattr(attr_name)
-                    target_var.setncattr(attr_name, attr_value)
+            target_var.setncatts(
+                {
+                    attr_name: source_var.getncattr(attr_name)
+                    for attr_name in source_var.ncattrs()
+                    if attr_name != "_FillValue"
+                }
+            )
 
         # Recursively copy subgroups
         for subgroup_name, source_subgroup in source_group.groups.items():
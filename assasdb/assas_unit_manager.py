@@ -66,7 +66,7 @@ class AssasUnitManager:
         # Check ASTEC mappings first
         if clean_unit in self.astec_unit_mapping:
             normalized = self.astec_unit_mapping[clean_unit]
-            logger.debug(f"Mapped ASTEC unit '{clean_unit}' to '{normalized}'")
+            logger.debug("Mapped ASTEC unit '%s' to '%s'", clean_unit, normalized)
             return normalized
 
         # Try to parse with cf-units
@@ -74,7 +74,7 @@ class AssasUnitManager:
             cf_unit = cf_units.Unit(clean_unit)
             return str(cf_unit)
         except Exception as e:
-            logger.debug(f"CF-units parsing failed for '{clean_unit}': {e}")
+            logger.debug("CF-units parsing failed for '%s': %s", clean_unit, e)
             pass
 
         # Try with pint
@@ -82,7 +82,7 @@ class AssasUnitManager:
             pint_unit = self.pint_registry.parse_expression(clean_unit)
             return str(pint_unit.units)
         except Exception as e:
-            logger.debug(f"Pint parsing failed for '{clean_unit}': {e}")
+            logger.debug("Pint parsing failed for '%s': %s", clean_unit, e)
             pass
 
         # Return original if all else fails
@@ -124,7 +124,7 @@ class AssasUnitManager:
             return cf_from.convert(value, cf_to)
         except Exception as e:
             logger.debug(
-                f"CF-units conversion failed from {from_unit} to {to_unit}: {e}."
+                "CF-units conversion failed from %s to %s: %s.", from_unit, to_unit, e
             )
             try:
                 # Try Pint
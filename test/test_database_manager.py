@@ -542,6 +542,33 @@ class AssasDatabaseManagerIntegrationTest(unittest.TestCase):
         ):
             self.manager.update_meta_data_of_valid_archives()
 
+    def test_update_meta_data_of_valid_archives_skips_unreadable_files(self) -> None:
+        """Test that an unreadable result file does not block the other archives."""
+        documents = [
+            {"system_path": f"archive_{index}", "system_result": f"result_{index}.nc"}
+            for index in range(3)
+        ]
+        self.mock_handler.get_file_documents_to_collect_meta_data.return_value = (
+            documents
+        )
+
+        def read_meta_values(netcdf4_file: str, group_name: str = None) -> List[dict]:
+            if netcdf4_file == "result_0.nc":
+                raise OSError(f"Unreadable file {netcdf4_file}.")
+            return [{"name": netcdf4_file}]
+
+        with patch(
+            "assasdb.assas_database_manager.AssasOdessaNetCDF4Converter.read_variables_meta_values_from_netcdf4",
+            side_effect=read_meta_values,
+        ):
+            self.manager.update_meta_data_of_valid_archives()
+
+        updated_paths = [
+            call.args[0]
+            for call in self.mock_handler.update_file_document_by_path.call_args_list
+        ]
+        self.assertEqual(updated_paths, ["archive_1", "archive_2"])
+
     def test_update_meta_data(self) -> None:
         """Test updating metadata for a specific UUID."""
         self.mock_handler.get_file_document_by_uuid.return_value = {}
@@ -9,11 +9,15 @@ import unittest
 import logging
 import shutil
 import tempfile
+from unittest import mock
 import HtmlTestRunner
 
 from pathlib import Path
+from typing import Iterator, List, Optional
 from logging.handlers import RotatingFileHandler
 import netCDF4
+import numpy as np
+import pandas as pd
 
 from assasdb import (
     AssasOdessaNetCDF4Converter,
@@ -167,6 +171,180 @@ class AssasOdessaNetCDF4ConverterTest(unittest.TestCase):
             f"Variable verification passed: {len(variables_from_index)} variables"
         )
 
+        # An unreadable file does not stop reading the other files
+        missing_path = Path(self.fake_tmp_dir) / "missing.nc"
+        netcdf4_files = [self.fake_output_path, missing_path, self.fake_output_path]
+        for number_of_workers in (1, 2):
+            meta_data_lists = self.converter.read_meta_values_from_netcdf4_files(
+                netcdf4_files, number_of_workers=number_of_workers
+            )
+            self.assertEqual(meta_data_lists, [meta_data_list, None, meta_data_list])
+
+        with netCDF4.Dataset(self.fake_output_path, "r") as ncfile:
+            self.assertEqual(ncfile["time_points"].chunking(), "contiguous")
+            # Spatial chunks do not exceed the extents of the written data
+            for name in variables_from_index:
+                variable = ncfile[name]
+                for chunk_size, extent in zip(
+                    variable.chunking()[1:], variable.shape[1:]
+                ):
+                    self.assertLessEqual(chunk_size, max(1, extent), name)
+
+    def test_convert_astec_archive_resume(self) -> None:
+        """Test resuming an interrupted conversion of the ASTEC archive."""
+        self.test_logger.info("Testing resumed ASTEC archive conversion")
+
+        time_points = self.converter.get_time_points()
+        if len(time_points) < 2:
+            self.skipTest("Test archive has less than two time points.")
+
+        try:
+            self.converter.convert_astec_variables_to_netcdf4(maximum_index=1)
+            self.converter.convert_astec_variables_to_netcdf4()
+        except Exception as e:
+            self.test_logger.error(f"Resumed conversion failed: {e}")
+            self.fail(f"Resumed conversion failed with exception: {e}.")
+
+        completed_index = (
+            AssasOdessaNetCDF4Converter.get_completed_index_from_netcdf4_file(
+                self.fake_output_path
+            )
+        )
+        self.assertEqual(completed_index, len(time_points) - 1)
+        self.test_logger.info(f"Resumed conversion completed at {completed_index}")
+
+    def test_convert_astec_archive_resume_before_first_flush(self) -> None:
+        """Test resuming a conversion interrupted before the first buffer flush."""
+        self.test_logger.info("Testing resume before the first write of the buffer")
+
+        time_points = self.converter.get_time_points()
+        if len(time_points) < 2:
+            self.skipTest("Test archive has less than two time points.")
+
+        parse_time_points = self.converter.parse_time_points
+
+        def interrupted_parse_time_points(
+            time_points: List[float],
+            conversion_plan: List[tuple],
+            number_of_workers: int = 1,
+        ) -> Iterator[List[np.ndarray]]:
+            for time_index, data_list in enumerate(
+                parse_time_points(time_points, conversion_plan, number_of_workers)
+            ):
+                if time_index == 1:
+                    raise RuntimeError("Conversion interrupted.")
+                yield data_list
+
+        with mock.patch.object(
+            self.converter,
+            "parse_time_points",
+            side_effect=interrupted_parse_time_points,
+        ):
+            with self.assertRaises(RuntimeError):
+                self.converter.convert_astec_variables_to_netcdf4()
+
+        self.assertEqual(
+            AssasOdessaNetCDF4Converter.get_completed_index_from_netcdf4_file(
+                self.fake_output_path
+            ),
+            -1,
+        )
+
+        self.converter.convert_astec_variables_to_netcdf4()
+
+        self.assertEqual(
+            AssasOdessaNetCDF4Converter.get_completed_index_from_netcdf4_file(
+                self.fake_output_path
+            ),
+            len(time_points) - 1,
+        )
+        with netCDF4.Dataset(self.fake_output_path, "r") as ncfile:
+            ncfile.set_auto_mask(False)
+            for name in self.converter.get_variable_index()["name"]:
+                first_time_point = ncfile[name][0]
+                self.assertFalse(
+                    np.all(first_time_point == netCDF4.default_fillvals["f4"]),
+                    f"Time point 0 of {name} was not written.",
+                )
+
+    def test_convert_astec_archive_without_mask_and_scale(self) -> None:
+        """Test that freshly created variables are written without mask and scale."""
+        self.test_logger.info("Testing disabled auto mask and scale on new variables")
+
+        write_buffered_data = AssasOdessaNetCDF4Converter.write_buffered_data
+        written_flags = {}
+
+        def record_write_buffered_data(
+            conversion_plan: List[tuple], *args: object
+        ) -> None:
+            for name, dataset, *_ in conversion_plan:
+                written_flags[name] = (dataset.mask, dataset.scale)
+            write_buffered_data(conversion_plan, *args)
+
+        with mock.patch.object(
+            AssasOdessaNetCDF4Converter,
+            "write_buffered_data",
+            side_effect=record_write_buffered_data,
+        ):
+            self.converter.convert_astec_variables_to_netcdf4()
+
+        self.assertEqual(
+            set(written_flags), set(self.converter.get_variable_index()["name"])
+        )
+        for name, (mask, scale) in written_flags.items():
+            self.assertIs(mask, False, f"Auto masking is enabled for {name}.")
+            self.assertIs(scale, False, f"Auto scaling is enabled for {name}.")
+
+        group_output_path = Path(self.fake_tmp_dir) / "group_output.nc"
+        with netCDF4.Dataset(group_output_path, "w", format="NETCDF4") as ncfile:
+            dimensions_group = ncfile.createGroup("dimensions")
+            dimensions_group.createDimension("time", None)
+            dimensions_group.createDimension("mesh", None)
+            dataset = self.converter.create_variable_with_unit(
+                ncfile.createGroup("test"),
+                dimensions_group,
+                "test_variable",
+                ("time", "mesh"),
+                "K",
+                "Test variable",
+            )
+            self.assertIs(dataset.mask, False)
+            self.assertIs(dataset.scale, False)
+
+    def test_convert_astec_archive_parallel(self) -> None:
+        """Test converting the ASTEC archive with parallel worker processes."""
+        self.test_logger.info("Testing parallel ASTEC archive conversion")
+
+        serial_output_path = Path(self.fake_tmp_dir) / "serial_output.nc"
+        serial_converter = AssasOdessaNetCDF4Converter(
+            input_path=self.fake_input_path,
+            output_path=serial_output_path,
+        )
+
+        try:
+            serial_converter.convert_astec_variables_to_netcdf4()
+            self.converter.convert_astec_variables_to_netcdf4(number_of_workers=2)
+        except Exception as e:
+            self.test_logger.error(f"Parallel conversion failed: {e}")
+            self.fail(f"Parallel conversion failed with exception: {e}.")
+
+        with (
+            netCDF4.Dataset(serial_output_path, "r") as serial_file,
+            netCDF4.Dataset(self.fake_output_path, "r") as parallel_file,
+        ):
+            self.assertEqual(
+                set(serial_file.variables.keys()), set(parallel_file.variables.keys())
+            )
+            serial_file.set_auto_maskandscale(False)
+            parallel_file.set_auto_maskandscale(False)
+            for name, variable in serial_file.variables.items():
+                np.testing.assert_array_equal(
+                    variable[:],
+                    parallel_file.variables[name][:],
+                    err_msg=f"Variable {name} differs between serial and parallel run.",
+                )
+        self.test_logger.info("Parallel conversion verification passed")
+
     def test_convert_astec_archive_with_groups(self) -> None:
         """Test converting the ASTEC archive with groups to NetCDF4 format.
 
@@ -226,6 +404,43 @@ class AssasOdessaNetCDF4ConverterTest(unittest.TestCase):
             self.test_logger.error(f"Failed to copy output file: {e}")
             self.fail(f"Failed to copy the output file with exception: {e}.")
 
+    def test_populate_specific_group_variables(self) -> None:
+        """Test populating single groups like the full grouped conversion."""
+        self.test_logger.info("Testing population of specific groups")
+
+        group_output_path = Path(self.fake_tmp_dir) / "group_output.nc"
+        group_converter = AssasOdessaNetCDF4Converter(
+            input_path=self.fake_input_path,
+            output_path=group_output_path,
+        )
+        for converter in (self.converter, group_converter):
+            converter.initialize_groups_in_netcdf4()
+            converter.intialize_astec_variables_in_netcdf4()
+
+        self.converter.populate_data_from_groups_to_netcdf4()
+        with netCDF4.Dataset(group_output_path, "r") as ncfile:
+            group_names = list(ncfile.groups)
+        for group_name in group_names:
+            group_converter.populate_specific_group_variables(group_name)
+
+        with (
+            netCDF4.Dataset(self.fake_output_path, "r") as full_file,
+            netCDF4.Dataset(group_output_path, "r") as group_file,
+        ):
+            full_file.set_auto_maskandscale(False)
+            group_file.set_auto_maskandscale(False)
+            variable_datasets = group_converter.get_variable_datasets_by_group(
+                group_file
+            )
+            self.assertGreater(len(variable_datasets), 0)
+            full_datasets = self.converter.get_all_variable_datasets(full_file)
+            for name, variable_info in variable_datasets.items():
+                np.testing.assert_array_equal(
+                    variable_info["dataset"][:],
+                    full_datasets[name]["dataset"][:],
+                    err_msg=f"Variable {name} differs from the full conversion.",
+                )
+
     def test_convert_astec_archive_meta(self) -> None:
         """Test converting the ASTEC archive metadata to NetCDF4 format."""
         self.test_logger.info("Testing ASTEC archive metadata conversion")
@@ -305,6 +520,337 @@ class AssasOdessaNetCDF4ConverterTest(unittest.TestCase):
         self.assertIsNotNone(meta_data, "Meta data should not be None.")
         self.test_logger.info("Individual metadata reading verification passed")
 
+    def test_lazy_converter_attributes(self) -> None:
+        """Test that time points and resource files are read on first access."""
+        for name in ("time_points", "variable_index", "magma_debris_ids"):
+            self.assertNotIn(name, self.converter.__dict__)
+
+        self.assertGreater(len(self.converter.get_time_points()), 0)
+        self.assertIn("time_points", self.converter.__dict__)
+        self.assertFalse(self.converter.get_variable_index().empty)
+        self.assertIn("variable_index", self.converter.__dict__)
+
+    def test_get_all_general_meta_data(self) -> None:
+        """Test reading all general meta data of a netCDF4 file at once."""
+        self.test_logger.info("Testing bulk reading of general meta data")
+
+        with netCDF4.Dataset(self.fake_output_path, "w", format="NETCDF4"):
+            pass
+        AssasOdessaNetCDF4Converter.set_general_meta_data(
+            output_path=self.fake_output_path,
+            title="Test title",
+            description="Test description",
+        )
+
+        meta_data = AssasOdessaNetCDF4Converter.get_all_general_meta_data(
+            self.fake_output_path
+        )
+        self.assertEqual(meta_data["title"], "Test title")
+        self.assertEqual(meta_data["description"], "Test description")
+        self.assertIn("creation_date", meta_data)
+
+        self.assertEqual(
+            AssasOdessaNetCDF4Converter.get_general_meta_data(
+                self.fake_output_path, "title"
+            ),
+            meta_data["title"],
+        )
+        with self.assertRaises(AttributeError):
+            AssasOdessaNetCDF4Converter.get_general_meta_data(
+                self.fake_output_path, "missing"
+            )
+        self.test_logger.info("Bulk meta data verification passed")
+
+    def test_parse_variable_covers_all_structures(self) -> None:
+        """Test that the parsers fill the first and the last structure."""
+        self.test_logger.info("Testing the index range of the parsers")
+
+        odessa_base = self.converter.get_odessa_base_from_index(0)
+        number_of_meshes = odessa_base.get("VESSEL").len("MESH")
+        number_of_volumes = odessa_base.get("PRIMARY").len("VOLUME")
+
+        array = self.converter.variable_strategy_mapping["vessel_mesh_ther"](
+            odessa_base=odessa_base, variable_name="P"
+        )
+        self.assertEqual(array.shape, (number_of_meshes,))
+        self.assertFalse(np.isnan(array[0]))
+        self.assertFalse(np.isnan(array[-1]))
+
+        array = self.converter.variable_strategy_mapping["primary_volume_ther"](
+            odessa_base=odessa_base, variable_name="P"
+        )
+        self.assertEqual(array.shape, (number_of_volumes,))
+        self.assertFalse(np.isnan(array[0]))
+        self.assertFalse(np.isnan(array[-1]))
+
+        # Every source gets its own entry with the requested value of FLOW
+        number_of_sources = sum(
+            odessa_base.get(f"CONNECTI {number}").len("SOURCE")
+            for number in range(1, odessa_base.len("CONNECTI") + 1)
+        )
+        first_values = self.converter.parse_variable_from_connecti_source_index(
+            odessa_base=odessa_base, variable_name="FLOW", index=0
+        )
+        second_values = self.converter.parse_variable_from_connecti_source_index(
+            odessa_base=odessa_base, variable_name="FLOW", index=1
+        )
+        self.assertEqual(first_values.shape, (number_of_sources,))
+        self.assertFalse(np.isnan(first_values[-1]))
+        self.assertNotEqual(first_values[-1], second_values[-1])
+        self.test_logger.info("Index range verification passed")
+
+    def test_parse_variable_from_connecti_with_missing_connecti(self) -> None:
+        """Test that a missing CONNECTI structure leaves its entry at NaN."""
+        self.test_logger.info("Testing connecti parsing with a missing CONNECTI")
+
+        odessa_base = self.converter.get_odessa_base_from_index(0)
+        number_of_connectis = odessa_base.len("CONNECTI")
+        if number_of_connectis < 2:
+            self.skipTest("Test archive has less than two connectis.")
+
+        array = AssasOdessaNetCDF4Converter.parse_variable_from_connecti(
+            odessa_base, "Qsteam"
+        )
+        self.assertFalse(np.isnan(array[0]))
+
+        get_cached_odessa_structure = (
+            AssasOdessaNetCDF4Converter.get_cached_odessa_structure
+        )
+
+        def without_first_connecti(
+            odessa_base: object, odessa_path: str
+        ) -> Optional[object]:
+            if odessa_path == "CONNECTI 1":
+                return None
+            return get_cached_odessa_structure(odessa_base, odessa_path)
+
+        with mock.patch.object(
+            AssasOdessaNetCDF4Converter,
+            "get_cached_odessa_structure",
+            side_effect=without_first_connecti,
+        ):
+            missing_array = AssasOdessaNetCDF4Converter.parse_variable_from_connecti(
+                odessa_base, "Qsteam"
+            )
+        AssasOdessaNetCDF4Converter.clear_odessa_base_cache()
+
+        self.assertEqual(missing_array.shape, (number_of_connectis,))
+        self.assertTrue(np.isnan(missing_array[0]))
+        np.testing.assert_array_equal(missing_array[1:], array[1:])
+
+    def test_parse_odessa_base_returns_float32(self) -> None:
+        """Test that all strategies return the float32 stored in the file."""
+        self.test_logger.info("Testing the data type of the parsed variables")
+
+        variable_names = self.converter.get_variable_index()["name"]
+        conversion_plan = self.converter.get_conversion_plan(
+            dict.fromkeys(variable_names)
+        )
+        data_list = self.converter.parse_odessa_base(
+            self.converter.get_odessa_base_from_index(0), conversion_plan
+        )
+
+        self.assertEqual(len(data_list), len(conversion_plan))
+        for (name, *_), data in zip(conversion_plan, data_list):
+            self.assertEqual(data.dtype, np.float32, f"{name} is not float32.")
+
+        # The parsed odessa base is not kept alive by the structure cache
+        cache = AssasOdessaNetCDF4Converter._odessa_structure_cache
+        self.assertIsNone(cache["odessa_base"])
+        self.assertEqual(cache["structures"], {})
+        self.assertEqual(cache["lengths"], {})
+        self.test_logger.info("Data type verification passed")
+
+    def test_get_used_dimensions(self) -> None:
+        """Test that only referenced dimensions are created."""
+        variable_index = pd.DataFrame(
+            {"dimension": ["mesh", "none", "pipe;mesh", "wall_profile"]}
+        )
+        self.assertEqual(
+            AssasOdessaNetCDF4Converter.get_used_dimensions(variable_index),
+            ["mesh", "pipe", "wall_profile"],
+        )
+
+    def test_get_variable_storage_options(self) -> None:
+        """Test the compression and chunking options of the netCDF4 variables."""
+        self.assertEqual(
+            AssasOdessaNetCDF4Converter.get_variable_storage_options(10, ("mesh",)),
+            {},
+        )
+
+        options = AssasOdessaNetCDF4Converter.get_variable_storage_options(
+            1000, ("time",)
+        )
+        self.assertTrue(options["zlib"])
+        self.assertEqual(options["chunksizes"], (1000,))
+
+        options = AssasOdessaNetCDF4Converter.get_variable_storage_options(
+            10**6, ("time",)
+        )
+        self.assertEqual(options["chunksizes"], (2**18,))
+
+        # Unknown extents share the chunk with one write buffer of time points
+        options = AssasOdessaNetCDF4Converter.get_variable_storage_options(
+            1000, ("time", "channel", "mesh")
+        )
+        self.assertEqual(options["chunksizes"], (64, 64, 64))
+
+        # Small extents are chunked whole and leave the rest to the time chunk
+        options = AssasOdessaNetCDF4Converter.get_variable_storage_options(
+            1000, ("time", "mesh"), (5,)
+        )
+        self.assertEqual(options["chunksizes"], (1000, 5))
+
+        options = AssasOdessaNetCDF4Converter.get_variable_storage_options(
+            10**5, ("time", "channel", "mesh"), (3, 40)
+        )
+        self.assertEqual(options["chunksizes"], (2176, 3, 40))
+
+        options = AssasOdessaNetCDF4Converter.get_variable_storage_options(
+            1000, ("time", "mesh"), (10**5,)
+        )
+        self.assertEqual(options["chunksizes"], (64, 4096))
+
+        with netCDF4.Dataset(self.fake_output_path, "w", format="NETCDF4") as ncfile:
+            ncfile.createDimension("time", 1000)
+            variable = ncfile.createVariable(
+                "pressure",
+                np.float32,
+                ("time",),
+                **AssasOdessaNetCDF4Converter.get_variable_storage_options(
+                    1000, ("time",)
+                ),
+            )
+            AssasOdessaNetCDF4Converter.set_variable_chunk_cache(variable)
+            self.assertGreaterEqual(variable.get_var_chunk_cache()[0], 2**24)
+
+    def test_fill_beyond_written_shape(self) -> None:
+        """Test filling a variable whose dimension grew beyond its written shape."""
+        with netCDF4.Dataset(self.fake_output_path, "w", format="NETCDF4") as ncfile:
+            ncfile.createDimension("time", 4)
+            ncfile.createDimension("wall", None)
+            ncfile.createDimension("wall_profile", None)
+            dimensions = ("time", "wall", "wall_profile")
+            storage_options = AssasOdessaNetCDF4Converter.get_variable_storage_options(
+                4, dimensions, (2, 21)
+            )
+            temperature = ncfile.createVariable(
+                "temperature", np.float32, dimensions, **storage_options
+            )
+            pressure = ncfile.createVariable(
+                "pressure", np.float32, dimensions, **storage_options
+            )
+            temperature.set_auto_maskandscale(False)
+
+            data = np.arange(4 * 2 * 21, dtype=np.float32).reshape(4, 2, 21)
+            AssasOdessaNetCDF4Converter.write_time_point_data(
+                temperature, 0, list(data)
+            )
+            # The shared dimension grows through another variable
+            pressure[0] = np.zeros((3, 21), dtype=np.float32)
+
+            AssasOdessaNetCDF4Converter.fill_beyond_written_shape(
+                temperature, 0, 4, (2, 21)
+            )
+
+            values = temperature[:]
+            self.assertEqual(values.shape, (4, 3, 21))
+            np.testing.assert_array_equal(values[:, :2], data)
+            self.assertTrue(np.isnan(values[:, 2]).all())
+
+    def test_check_if_odessa_path_exists(self) -> None:
+        """Test checking the existence of odessa paths."""
+        self.test_logger.info("Testing existence check of odessa paths")
+
+        odessa_base = self.converter.get_odessa_base_from_index(0)
+
+        self.assertTrue(
+            AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
+                odessa_base, "CONTAINM 1"
+            )
+        )
+        self.assertTrue(
+            AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
+                odessa_base, "CONTAINM"
+            )
+        )
+        self.assertFalse(
+            AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
+                odessa_base, "CONTAINM 999"
+            )
+        )
+        self.assertFalse(
+            AssasOdessaNetCDF4Converter.check_if_odessa_path_exists(
+                odessa_base, "CONTAINM 1: ZONE 999: THER 1"
+            )
+        )
+
+        self.assertIsNotNone(
+            AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                odessa_base, "CONTAINM 1"
+            )
+        )
+        self.assertIsNone(
+            AssasOdessaNetCDF4Converter.get_odessa_structure_if_exists(
+                odessa_base, "CONTAINM 1: ZONE 999: THER 1"
+            )
+        )
+
+        self.assertEqual(
+            AssasOdessaNetCDF4Converter.parse_odessa_path("VESSEL 1: MESH 2: THER"),
+            (
+                ("VESSEL", 1, "VESSEL 1", "VESSEL 1"),
+                ("MESH", 2, "MESH 2", "MESH 2"),
+                ("THER", 1, "THER 1", "THER"),
+            ),
+        )
+        self.test_logger.info("Odessa path existence verification passed")
+
+    def test_get_cached_odessa_structure(self) -> None:
+        """Test caching of odessa substructures per odessa base."""
+        self.test_logger.info("Testing cache of odessa substructures")
+
+        odessa_base = self.converter.get_odessa_base_from_index(0)
+
+        structure = AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+            odessa_base, "CONTAINM 1"
+        )
+        self.assertIsNotNone(structure)
+        self.assertIs(
+            AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                odessa_base, "CONTAINM 1"
+            ),
+            structure,
+        )
+        self.assertIsNone(
+            AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                odessa_base, "CONTAINM 999"
+            )
+        )
+
+        other_base = self.converter.get_odessa_base_from_index(0)
+        self.assertIsNot(
+            AssasOdessaNetCDF4Converter.get_cached_odessa_structure(
+                other_base, "CONTAINM 1"
+            ),
+            structure,
+        )
+
+        number_of_walls = structure.len("WALL")
+        self.assertEqual(
+            AssasOdessaNetCDF4Converter.get_cached_number_of_structures(
+                odessa_base, "CONTAINM 1", "WALL"
+            ),
+            number_of_walls,
+        )
+        self.assertEqual(
+            AssasOdessaNetCDF4Converter.get_cached_number_of_structures(
+                odessa_base, "CONTAINM 999", "WALL"
+            ),
+            0,
+        )
+        self.test_logger.info("Odessa substructure cache verification passed")
+
     def test_migrate_variables_from_old_to_new_structure(self) -> None:
         """Test to migrating variables from old structure without groups.
 